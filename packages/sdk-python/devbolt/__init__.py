@@ -1,6 +1,6 @@
 """DevBolt - Git-native feature flags for developers."""
 
-from .client import DevBoltClient
+from .client import DevBoltClient, EvaluationScope
 from .engine import FlagEngine
 from .logger import create_logger
 from .parser import ConfigParser
@@ -25,6 +25,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Client
     "DevBoltClient",
+    "EvaluationScope",
     # Engine
     "FlagEngine",
     # Parser
@@ -1,25 +1,26 @@
 """DevBolt SDK client for feature flag evaluation."""
 
+import os
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, Optional, Union
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Union
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 
-
 if TYPE_CHECKING:
-    from watchdog.observers import Observer as ObserverType
+    from watchdog.observers.api import BaseObserver as ObserverType
 else:
     from watchdog.observers import Observer as ObserverType
 
 from .engine import FlagEngine
 from .logger import create_logger
-from .parser import ConfigParser
+from .parser import ConfigParser, content_digest
 from .types import (
     ConfigParseError,
     EvaluationContext,
     EvaluationResult,
     EvaluationMetadata,
+    FlagConfig,
     FlagsConfig,
     LogLevel,
     Logger,
@@ -29,25 +30,55 @@ from .types import (
 class ConfigFileHandler(FileSystemEventHandler):
     """File system event handler for config changes."""
 
-    def __init__(self, config_path: str, on_change: Callable[[], None]) -> None:
+    def __init__(
+        self,
+        config_path: str,
+        on_change: Callable[[], None],
+        last_hash: Optional[bytes] = None,
+    ) -> None:
         """Initialize handler.
 
         Args:
             config_path: Path to config file
             on_change: Callback when file changes
+            last_hash: content_digest of the loaded config (the file is hashed if not provided)
         """
         self.config_path = config_path
         self.on_change = on_change
-        self._last_modified = 0.0
+        self._last_hash = last_hash if last_hash is not None else self._content_hash()
+
+    def _content_hash(self) -> Optional[bytes]:
+        """Hash the config file contents (None if unreadable)."""
+        try:
+            with open(self.config_path, "rb") as f:
+                return content_digest(f.read())
+        except OSError:
+            return None
+
+    def _handle_change(self) -> None:
+        """Trigger a reload only when the file contents actually changed."""
+        # Editors often emit several events per save with identical content
+        current_hash = self._content_hash()
+        if current_hash is None or current_hash == self._last_hash:
+            return
+
+        self._last_hash = current_hash
+        self.on_change()
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification event."""
         if event.src_path == self.config_path:
-            # Debounce rapid changes
-            current_time = time.time()
-            if current_time - self._last_modified > 0.1:
-                self._last_modified = current_time
-                self.on_change()
+            self._handle_change()
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle file creation event (e.g. delete-and-recreate saves)."""
+        if event.src_path == self.config_path:
+            self._handle_change()
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle file move event (atomic rename saves)."""
+        if getattr(event, "dest_path", None) == self.config_path:
+            self._handle_change()
 
 
 class DevBoltClient:
@@ -108,6 +139,8 @@ class DevBoltClient:
         self._last_load_time = 0.0
         self._observer: Optional[ObserverType] = None
         self._engine: Optional[FlagEngine] = None
+        # Digest of the config bytes last loaded, seeding the file watcher
+        self._config_digest: Optional[bytes] = None
 
         # Find and load config
         try:
@@ -154,12 +187,20 @@ class DevBoltClient:
                 raise ConfigParseError(f"Config file not found: {custom_path}")
             return str(path.absolute())
 
-        # Search default locations
+        # Search default locations (one directory listing instead of a stat per location)
+        try:
+            with os.scandir(".") as entries:
+                cwd_entries = {entry.name for entry in entries}
+        except OSError:
+            cwd_entries = set()
+
         for location in self.DEFAULT_LOCATIONS:
-            path = Path(location)
-            if path.exists():
+            head, _, _ = location.partition("/")
+            if head not in cwd_entries:
+                continue
+            if head == location or os.path.exists(location):
                 self.logger.debug(f"Found config file at: {location}")
-                return str(path.absolute())
+                return str(Path(location).absolute())
 
         searched = "\n  - ".join(self.DEFAULT_LOCATIONS)
         raise ConfigParseError(
@@ -171,7 +212,7 @@ class DevBoltClient:
         """Load configuration from file."""
         try:
             self.logger.debug(f"Loading config from: {self.config_path}")
-            config = ConfigParser.parse_file(self.config_path)
+            config, self._config_digest = ConfigParser.parse_file_with_digest(self.config_path)
 
             self._engine = FlagEngine(
                 config,
@@ -196,7 +237,10 @@ class DevBoltClient:
         try:
             from watchdog.observers import Observer
 
-            event_handler = ConfigFileHandler(self.config_path, self._reload_config)
+            # Seed with the loaded bytes so edits made since loading still reload
+            event_handler = ConfigFileHandler(
+                self.config_path, self._reload_config, self._config_digest
+            )
 
             self._observer = Observer()
             watch_dir = str(Path(self.config_path).parent)
@@ -242,6 +286,28 @@ class DevBoltClient:
         """
         return self._initialized and self._engine is not None
 
+    def _merge_context(self, context: Optional[EvaluationContext]) -> EvaluationContext:
+        """Merge an evaluation context over the default context.
+
+        Standard fields come from ``context`` when given, custom attributes are
+        layered over the defaults. Existing objects are reused when nothing
+        needs merging.
+        """
+        if context is None:
+            return self.default_context
+
+        default_attributes = self.default_context.custom_attributes
+        if not default_attributes:
+            return context
+
+        return EvaluationContext(
+            user_id=context.user_id,
+            email=context.email,
+            environment=context.environment,
+            custom_attributes={**default_attributes, **(context.custom_attributes or {})},
+            _hash_seed=context._hash_seed,
+        )
+
     def evaluate(
         self,
         flag_name: str,
@@ -256,26 +322,47 @@ class DevBoltClient:
         Returns:
             EvaluationResult
         """
-        # Check initialization
-        if not self.is_initialized():
-            fallback = self.fallbacks.get(flag_name, False)
-            return EvaluationResult(
-                flag_name=flag_name,
-                enabled=fallback,
-                reason="Client not initialized, using fallback",
-                metadata=EvaluationMetadata(timestamp=time.time()),
-            )
+        return self._evaluate_merged(flag_name, self._merge_context(context))
 
-        # Merge contexts
-        merged_context = EvaluationContext(
-            user_id=context.user_id if context else self.default_context.user_id,
-            email=context.email if context else self.default_context.email,
-            environment=context.environment if context else self.default_context.environment,
-            custom_attributes={
-                **(self.default_context.custom_attributes or {}),
-                **(context.custom_attributes if context and context.custom_attributes else {}),
-            },
-        )
+    def evaluate_many(
+        self,
+        flag_names: Optional[Iterable[str]] = None,
+        context: Optional[EvaluationContext] = None,
+    ) -> Dict[str, EvaluationResult]:
+        """Evaluate several feature flags, merging the context only once.
+
+        Args:
+            flag_names: Names of the flags (all flags if not provided)
+            context: Optional evaluation context
+
+        Returns:
+            Mapping of flag name to EvaluationResult
+        """
+        merged_context = self._merge_context(context)
+        names = self.get_all_flags() if flag_names is None else flag_names
+        return {name: self._evaluate_merged(name, merged_context) for name in names}
+
+    def scope(self, context: Optional[EvaluationContext] = None) -> "EvaluationScope":
+        """Create a scope that reuses one merged context for many evaluations.
+
+        Useful per request: the context is merged with the default context
+        once instead of on every flag check.
+
+        Args:
+            context: Optional evaluation context
+
+        Returns:
+            EvaluationScope bound to this client
+        """
+        return EvaluationScope(self, self._merge_context(context))
+
+    def _evaluate_merged(
+        self, flag_name: str, merged_context: EvaluationContext
+    ) -> EvaluationResult:
+        """Evaluate a flag with an already merged context."""
+        # Check initialization
+        if not self.is_initialized() or self._engine is None:
+            return self._fallback_result(flag_name, "Client not initialized, using fallback")
 
         try:
             result = self._engine.evaluate(flag_name, merged_context)
@@ -292,13 +379,16 @@ class DevBoltClient:
             self._handle_error(e)
 
             # Return fallback
-            fallback = self.fallbacks.get(flag_name, False)
-            return EvaluationResult(
-                flag_name=flag_name,
-                enabled=fallback,
-                reason=f"Error evaluating flag: {str(e)}",
-                metadata=EvaluationMetadata(timestamp=time.time()),
-            )
+            return self._fallback_result(flag_name, f"Error evaluating flag: {str(e)}")
+
+    def _fallback_result(self, flag_name: str, reason: str) -> EvaluationResult:
+        """Create a result from the configured fallback value."""
+        return EvaluationResult(
+            flag_name=flag_name,
+            enabled=self.fallbacks.get(flag_name, False),
+            reason=reason,
+            metadata=EvaluationMetadata(timestamp=time.time()),
+        )
 
     def is_enabled(
         self,
@@ -314,6 +404,9 @@ class DevBoltClient:
         Returns:
             True if enabled, False otherwise
         """
+        # Fallbacks need no result object when only the boolean is wanted
+        if not self.is_initialized():
+            return self.fallbacks.get(flag_name, False)
         return self.evaluate(flag_name, context).enabled
 
     def get_all_flags(self) -> list[str]:
@@ -322,11 +415,11 @@ class DevBoltClient:
         Returns:
             List of flag names
         """
-        if not self.is_initialized():
+        if not self.is_initialized() or self._engine is None:
             return []
         return self._engine.get_all_flags()
 
-    def get_flag_config(self, flag_name: str) -> Optional[FlagsConfig]:
+    def get_flag_config(self, flag_name: str) -> Optional[FlagConfig]:
         """Get flag configuration.
 
         Args:
@@ -335,7 +428,7 @@ class DevBoltClient:
         Returns:
             FlagConfig if found, None otherwise
         """
-        if not self.is_initialized():
+        if not self.is_initialized() or self._engine is None:
             return None
         return self._engine.get_flag_config(flag_name)
 
@@ -345,7 +438,7 @@ class DevBoltClient:
         Returns:
             Flags configuration
         """
-        if not self.is_initialized():
+        if not self.is_initialized() or self._engine is None:
             return {}
         return self._engine.get_config()
 
@@ -365,3 +458,39 @@ class DevBoltClient:
 
         self._engine = None
         self._initialized = False
+
+
+class EvaluationScope:
+    """Evaluates flags against a context merged once with the client defaults."""
+
+    def __init__(self, client: DevBoltClient, context: EvaluationContext) -> None:
+        """Initialize scope.
+
+        Args:
+            client: Client used for evaluation
+            context: Merged evaluation context
+        """
+        self.client = client
+        self.context = context
+
+    def evaluate(self, flag_name: str) -> EvaluationResult:
+        """Evaluate a feature flag in this scope.
+
+        Args:
+            flag_name: Name of the flag
+
+        Returns:
+            EvaluationResult
+        """
+        return self.client._evaluate_merged(flag_name, self.context)
+
+    def is_enabled(self, flag_name: str) -> bool:
+        """Check if a flag is enabled in this scope.
+
+        Args:
+            flag_name: Name of the flag
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        return self.client._evaluate_merged(flag_name, self.context).enabled
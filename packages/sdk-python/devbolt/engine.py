@@ -1,10 +1,10 @@
 """Main engine for feature flag evaluation."""
 
 import time
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from .evaluator import FlagEvaluator
-from .logger import NoOpLogger
+from .logger import NOOP_LOGGER
 from .parser import ConfigParser
 from .types import (
     EvaluationContext,
@@ -14,6 +14,7 @@ from .types import (
     FlagNotFoundError,
     FlagsConfig,
     Logger,
+    TargetingEvaluator,
 )
 
 
@@ -34,9 +35,10 @@ class FlagEngine:
             strict: Enable strict mode (throw on missing flags)
         """
         self._config = config
-        self.logger = logger or NoOpLogger()
+        self.logger = logger or NOOP_LOGGER
         self.strict = strict
         self.evaluator = FlagEvaluator(self.logger)
+        self._compiled_targeting = self._compile_flags(config)
 
         self.logger.info(
             "FlagEngine initialized",
@@ -118,7 +120,60 @@ class FlagEngine:
             )
 
         eval_context = context or EvaluationContext()
-        return self.evaluator.evaluate(flag_name, flag_config, eval_context)
+        return self.evaluator.evaluate(
+            flag_name, flag_config, eval_context, self._compiled_targeting.get(flag_name)
+        )
+
+    def evaluate_many(
+        self,
+        flag_names: Optional[Iterable[str]] = None,
+        context: Optional[EvaluationContext] = None,
+    ) -> Dict[str, EvaluationResult]:
+        """Evaluate several feature flags against one context.
+
+        Args:
+            flag_names: Names of the flags (all flags if not provided)
+            context: Optional evaluation context
+
+        Returns:
+            Mapping of flag name to EvaluationResult
+
+        Raises:
+            FlagNotFoundError: If a flag is not found and strict mode enabled
+        """
+        eval_context = context or EvaluationContext()
+        names = self._config.keys() if flag_names is None else flag_names
+        return {name: self.evaluate(name, eval_context) for name in names}
+
+    def is_enabled_batch(
+        self,
+        flag_name: str,
+        contexts: Sequence[EvaluationContext],
+    ) -> List[bool]:
+        """Check a flag for many contexts at once.
+
+        Args:
+            flag_name: Name of the flag
+            contexts: Evaluation contexts
+
+        Returns:
+            Enabled state per context, in the order of contexts
+
+        Raises:
+            FlagNotFoundError: If flag not found and strict mode enabled
+        """
+        flag_config = self._config.get(flag_name)
+
+        if not flag_config:
+            if self.strict:
+                raise FlagNotFoundError(flag_name)
+
+            self.logger.warn(f"Flag '{flag_name}' not found, returning disabled")
+            return [False] * len(contexts)
+
+        return self.evaluator.is_enabled_batch(
+            flag_name, flag_config, contexts, self._compiled_targeting.get(flag_name)
+        )
 
     def is_enabled(
         self,
@@ -163,14 +218,47 @@ class FlagEngine:
         """
         return self._config.copy()
 
+    def _compile_flags(self, config: FlagsConfig) -> Dict[str, TargetingEvaluator]:
+        """Precompile targeting rules for every flag that has any."""
+        compiled: Dict[str, TargetingEvaluator] = {}
+        for flag_name, flag_config in config.items():
+            evaluate_targeting = self.evaluator.compile_targeting(flag_name, flag_config)
+            if evaluate_targeting is not None:
+                compiled[flag_name] = evaluate_targeting
+        return compiled
+
     def update_config(self, config: FlagsConfig) -> None:
         """Update configuration (for hot reloading).
 
+        Flags whose configuration is unchanged keep their existing FlagConfig
+        and compiled targeting; only new or changed flags are recompiled. Rollout
+        buckets are pure over flag name, identifier and seed, so the bucket
+        cache stays valid across updates.
+
         Args:
             config: New flags configuration
         """
-        self._config = config
+        previous = self._config
+        previous_compiled = self._compiled_targeting
+        updated: FlagsConfig = {}
+        compiled: Dict[str, TargetingEvaluator] = {}
+        changed = 0
+
+        for flag_name, flag_config in config.items():
+            existing = previous.get(flag_name)
+            if existing is not None and existing == flag_config:
+                updated[flag_name] = existing
+                evaluate_targeting = previous_compiled.get(flag_name)
+            else:
+                updated[flag_name] = flag_config
+                evaluate_targeting = self.evaluator.compile_targeting(flag_name, flag_config)
+                changed += 1
+            if evaluate_targeting is not None:
+                compiled[flag_name] = evaluate_targeting
+
+        self._config = updated
+        self._compiled_targeting = compiled
         self.logger.info(
             "Configuration updated",
-            {"flag_count": len(config)},
+            {"flag_count": len(config), "changed_count": changed},
         )
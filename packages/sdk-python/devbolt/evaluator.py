@@ -1,21 +1,177 @@
 """Flag evaluator for DevBolt."""
 
-import re
 import time
-from typing import Optional, Union
+from dataclasses import asdict
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from .hasher import Hasher
-from .logger import NoOpLogger
+from .logger import NOOP_LOGGER, is_debug_enabled
 from .types import (
+    TARGETING_OPERATORS,
     EvaluationContext,
     EvaluationMetadata,
     EvaluationResult,
     FlagConfig,
     Logger,
+    TargetingEvaluator,
     TargetingRule,
 )
 
 
+def _match_equals(rule: TargetingRule, value: Any) -> bool:
+    return bool(value == rule.value)
+
+
+def _match_not_equals(rule: TargetingRule, value: Any) -> bool:
+    return bool(value != rule.value)
+
+
+def _match_in(rule: TargetingRule, value: Any) -> bool:
+    if rule._values_set is not None:
+        return value in rule._values_set
+    return rule.values is not None and value in rule.values
+
+
+def _match_not_in(rule: TargetingRule, value: Any) -> bool:
+    if rule._values_set is not None:
+        return value not in rule._values_set
+    return rule.values is None or value not in rule.values
+
+
+def _match_contains(rule: TargetingRule, value: Any) -> bool:
+    return rule._value_lower in str(value).lower()  # type: ignore
+
+
+def _match_not_contains(rule: TargetingRule, value: Any) -> bool:
+    return rule._value_lower not in str(value).lower()  # type: ignore
+
+
+def _match_starts_with(rule: TargetingRule, value: Any) -> bool:
+    return str(value).lower().startswith(rule._value_lower)  # type: ignore
+
+
+def _match_ends_with(rule: TargetingRule, value: Any) -> bool:
+    return str(value).lower().endswith(rule._value_lower)  # type: ignore
+
+
+def _match_greater_than(rule: TargetingRule, value: Any) -> bool:
+    return float(value) > float(rule.value)  # type: ignore
+
+
+def _match_less_than(rule: TargetingRule, value: Any) -> bool:
+    return float(value) < float(rule.value)  # type: ignore
+
+
+def _match_greater_than_or_equal(rule: TargetingRule, value: Any) -> bool:
+    return float(value) >= float(rule.value)  # type: ignore
+
+
+def _match_less_than_or_equal(rule: TargetingRule, value: Any) -> bool:
+    return float(value) <= float(rule.value)  # type: ignore
+
+
+def _match_regex(rule: TargetingRule, value: Any) -> bool:
+    return rule._compiled_regex.search(str(value)) is not None  # type: ignore
+
+
+RuleMatcher = Callable[[TargetingRule, Any], bool]
+
+# Operator dispatch table (one dict lookup instead of an if/elif chain)
+OPERATOR_MATCHERS: Dict[str, RuleMatcher] = {
+    "equals": _match_equals,
+    "not_equals": _match_not_equals,
+    "in": _match_in,
+    "not_in": _match_not_in,
+    "contains": _match_contains,
+    "not_contains": _match_not_contains,
+    "starts_with": _match_starts_with,
+    "ends_with": _match_ends_with,
+    "greater_than": _match_greater_than,
+    "less_than": _match_less_than,
+    "greater_than_or_equal": _match_greater_than_or_equal,
+    "less_than_or_equal": _match_less_than_or_equal,
+    "matches_regex": _match_regex,
+}
+
+# OPERATOR_MATCHERS indexed by TargetingRule._op_code
+OPERATOR_TABLE: Tuple[RuleMatcher, ...] = tuple(
+    OPERATOR_MATCHERS[operator] for operator in TARGETING_OPERATORS
+)
+
+RulePredicate = Callable[[Any], bool]
+
+
+def _rule_predicate(rule: TargetingRule, matcher: RuleMatcher) -> RulePredicate:
+    """Bind a rule to a single-argument predicate over the attribute value.
+
+    Common operators get a specialized callable over the rule's precomputed
+    state; the rest wrap their matcher. The predicate only reflects the rule
+    as it is now, so compile_targeting rebuilds it when rule._revision changes.
+    """
+    operator = rule.operator
+    values_set = rule._values_set
+    if operator == "in" and values_set is not None:
+        return values_set.__contains__
+    if operator == "not_in" and values_set is not None:
+        return lambda value: value not in values_set
+    if operator == "equals":
+        expected = rule.value
+        return lambda value: bool(value == expected)
+    expected_lower = rule._value_lower
+    if expected_lower is not None:
+        if operator == "ends_with":
+            return lambda value: str(value).lower().endswith(expected_lower)
+        if operator == "starts_with":
+            return lambda value: str(value).lower().startswith(expected_lower)
+        if operator == "contains":
+            return lambda value: expected_lower in str(value).lower()
+    if operator == "matches_regex" and rule._compiled_regex is not None:
+        search = rule._compiled_regex.search
+        return lambda value: search(str(value)) is not None
+    return partial(matcher, rule)
+
+
+AttributeGetter = Callable[[EvaluationContext], Optional[Union[str, int, float, bool]]]
+
+# Rule attributes that map to standard EvaluationContext fields
+STANDARD_ATTRIBUTES: Dict[str, AttributeGetter] = {
+    "userId": attrgetter("user_id"),
+    "email": attrgetter("email"),
+    "environment": attrgetter("environment"),
+}
+
+
+def _attribute_getter(attribute: str) -> AttributeGetter:
+    """Resolve a rule attribute to a getter once, ahead of evaluation."""
+    getter = STANDARD_ATTRIBUTES.get(attribute)
+    if getter is not None:
+        return getter
+
+    def get_custom_attribute(context: EvaluationContext) -> Optional[Union[str, int, float, bool]]:
+        custom_attributes = context.custom_attributes
+        return custom_attributes.get(attribute) if custom_attributes else None
+
+    return get_custom_attribute
+
+
+CompiledRule = Tuple[TargetingRule, int, AttributeGetter, Optional[RulePredicate], str, int]
+
+
+def _compile_rule(index: int, rule: TargetingRule) -> CompiledRule:
+    """Resolve a rule's getter, predicate and match reason for compile_targeting.
+
+    The rule's revision is recorded so edits made after compiling are detected.
+    """
+    reason = f"Matched targeting rule #{index + 1}"
+    if rule.description:
+        reason += f": {rule.description}"
+    matcher = OPERATOR_MATCHERS.get(rule.operator)
+    predicate = _rule_predicate(rule, matcher) if matcher is not None else None
+    return (rule, rule._revision, _attribute_getter(rule.attribute), predicate, reason, index)
+
+
 class FlagEvaluator:
     """Evaluates feature flags based on configuration and context."""
 
@@ -25,10 +181,14 @@ class FlagEvaluator:
         Args:
             logger: Optional logger instance
         """
-        self.logger = logger or NoOpLogger()
+        self.logger = logger or NOOP_LOGGER
 
     def evaluate(
-        self, flag_name: str, config: FlagConfig, context: EvaluationContext
+        self,
+        flag_name: str,
+        config: FlagConfig,
+        context: EvaluationContext,
+        compiled_targeting: Optional[TargetingEvaluator] = None,
     ) -> EvaluationResult:
         """Evaluate a feature flag.
 
@@ -36,74 +196,184 @@ class FlagEvaluator:
             flag_name: Name of the flag
             config: Flag configuration
             context: Evaluation context
+            compiled_targeting: Optional evaluator from compile_targeting
 
         Returns:
             EvaluationResult with enabled status and reason
         """
-        start_time = time.time()
-        self.logger.debug(f"Evaluating flag '{flag_name}'", {"context": context.__dict__})
+        timestamp = time.time()
+        start_ns = None
 
+        # Debug messages (and durations) are only built when they will be output
+        if is_debug_enabled(self.logger):
+            start_ns = time.perf_counter_ns()
+            self.logger.debug(f"Evaluating flag '{flag_name}'", {"context": asdict(context)})
+
+        # Each stage is only entered when the flag configures it, so plain
+        # on/off flags skip straight to the default
         # Priority 1: Environment override
-        env_result = self._evaluate_environment(flag_name, config, context)
-        if env_result:
-            return self._create_result(flag_name, env_result[0], env_result[1], start_time)
+        if config.environments:
+            env_result = self._evaluate_environment(flag_name, config, context)
+            if env_result:
+                return self._create_result(
+                    flag_name, env_result[0], env_result[1], timestamp, start_ns=start_ns
+                )
 
         # Priority 2: Global disabled
         if not config.enabled:
-            return self._create_result(flag_name, False, "Flag is disabled globally", start_time)
+            return self._create_result(
+                flag_name, False, "Flag is disabled globally", timestamp, start_ns=start_ns
+            )
 
         # Priority 3: Targeting rules
-        targeting_result = self._evaluate_targeting(flag_name, config, context)
-        if targeting_result:
-            return self._create_result(
-                flag_name,
-                targeting_result[0],
-                targeting_result[1],
-                start_time,
-                matched_rule=targeting_result[2],
+        if config.targeting:
+            targeting_result = self._evaluate_targeting(
+                flag_name, config, context, compiled_targeting
             )
+            if targeting_result:
+                return self._create_result(
+                    flag_name,
+                    targeting_result[0],
+                    targeting_result[1],
+                    timestamp,
+                    matched_rule=targeting_result[2],
+                    start_ns=start_ns,
+                )
 
         # Priority 4: Rollout percentage
-        rollout_result = self._evaluate_rollout(flag_name, config, context)
-        if rollout_result:
-            return self._create_result(
-                flag_name,
-                rollout_result[0],
-                rollout_result[1],
-                start_time,
-                rollout_bucket=rollout_result[2],
-            )
+        if config.rollout:
+            rollout_result = self._evaluate_rollout(flag_name, config, context)
+            if rollout_result:
+                return self._create_result(
+                    flag_name,
+                    rollout_result[0],
+                    rollout_result[1],
+                    timestamp,
+                    rollout_bucket=rollout_result[2],
+                    start_ns=start_ns,
+                )
 
         # Default: enabled for all
-        return self._create_result(flag_name, True, "Flag is enabled for all users", start_time)
+        return self._create_result(
+            flag_name, True, "Flag is enabled for all users", timestamp, start_ns=start_ns
+        )
+
+    def is_enabled_batch(
+        self,
+        flag_name: str,
+        config: FlagConfig,
+        contexts: Sequence[EvaluationContext],
+        compiled_targeting: Optional[TargetingEvaluator] = None,
+    ) -> List[bool]:
+        """Evaluate one flag for many contexts, returning only enabled states.
+
+        Applies the same priorities as evaluate but reads the flag's
+        configuration once for the whole batch, skips per-context result
+        objects and debug logging, and hashes pending rollout identifiers
+        one seed group at a time through Hasher.get_buckets.
+
+        Args:
+            flag_name: Name of the flag
+            config: Flag configuration
+            contexts: Evaluation contexts
+            compiled_targeting: Optional evaluator from compile_targeting
+
+        Returns:
+            Enabled state per context, in the order of contexts
+        """
+        environments = config.environments
+        targeting = config.targeting
+        rollout = config.rollout
+        enabled = config.enabled
+
+        results: List[bool] = []
+        # Rollout identifiers still to hash, grouped by seed: seed -> (indices, identifiers)
+        pending: Dict[Optional[str], Tuple[List[int], List[str]]] = {}
+
+        for index, context in enumerate(contexts):
+            if environments and context.environment:
+                env_enabled = environments.get(context.environment)
+                if env_enabled is not None:
+                    results.append(env_enabled)
+                    continue
+
+            if not enabled:
+                results.append(False)
+                continue
+
+            if targeting:
+                targeting_result = self._evaluate_targeting(
+                    flag_name, config, context, compiled_targeting
+                )
+                if targeting_result:
+                    results.append(targeting_result[0])
+                    continue
+
+            if rollout and 0 < rollout.percentage < 100:
+                indices, identifiers = pending.setdefault(
+                    rollout.seed or context._hash_seed, ([], [])
+                )
+                indices.append(index)
+                identifiers.append(context.user_id or context.email or "anonymous")
+                results.append(False)
+                continue
+
+            results.append(not rollout or rollout.percentage >= 100)
+
+        if rollout:
+            percentage = rollout.percentage
+            for seed, (indices, identifiers) in pending.items():
+                for index, bucket in zip(indices, Hasher.get_buckets(flag_name, identifiers, seed)):
+                    results[index] = bucket < percentage
+
+        return results
 
     def _evaluate_environment(
         self, flag_name: str, config: FlagConfig, context: EvaluationContext
     ) -> Optional[tuple[bool, str]]:
         """Evaluate environment-specific override."""
-        if not config.environments or not context.environment:
+        environments = config.environments
+        environment = context.environment
+        if not environments or not environment:
             return None
 
-        env_enabled = config.environments.get(context.environment)
+        env_enabled = environments.get(environment)
         if env_enabled is None:
             return None
 
-        self.logger.debug(
-            f"Flag '{flag_name}' environment override: {context.environment} = {env_enabled}"
-        )
+        if is_debug_enabled(self.logger):
+            self.logger.debug(
+                f"Flag '{flag_name}' environment override: {environment} = {env_enabled}"
+            )
 
-        return (env_enabled, f"Environment override: {context.environment}")
+        return (env_enabled, f"Environment override: {environment}")
 
     def _evaluate_targeting(
-        self, flag_name: str, config: FlagConfig, context: EvaluationContext
+        self,
+        flag_name: str,
+        config: FlagConfig,
+        context: EvaluationContext,
+        compiled_targeting: Optional[TargetingEvaluator] = None,
     ) -> Optional[tuple[bool, str, int]]:
         """Evaluate targeting rules."""
-        if not config.targeting:
+        if compiled_targeting is not None:
+            return compiled_targeting(context)
+        return self._evaluate_rules(flag_name, config.targeting, context)
+
+    def _evaluate_rules(
+        self,
+        flag_name: str,
+        targeting: Optional[List[TargetingRule]],
+        context: EvaluationContext,
+    ) -> Optional[tuple[bool, str, int]]:
+        """Evaluate targeting rules one by one, without precompiled state."""
+        if not targeting:
             return None
 
-        for index, rule in enumerate(config.targeting):
+        for index, rule in enumerate(targeting):
             if self._rule_matches(rule, context):
-                self.logger.debug(f"Flag '{flag_name}' matched targeting rule #{index + 1}")
+                if is_debug_enabled(self.logger):
+                    self.logger.debug(f"Flag '{flag_name}' matched targeting rule #{index + 1}")
 
                 reason = f"Matched targeting rule #{index + 1}"
                 if rule.description:
@@ -113,63 +383,83 @@ class FlagEvaluator:
 
         return None
 
-    def _rule_matches(self, rule: TargetingRule, context: EvaluationContext) -> bool:
-        """Check if a targeting rule matches the context."""
-        attribute_value = self._get_attribute_value(rule.attribute, context)
-
-        # If attribute doesn't exist, rule doesn't match
-        if attribute_value is None:
-            return False
-
-        try:
-            operator = rule.operator
+    def compile_targeting(self, flag_name: str, config: FlagConfig) -> Optional[TargetingEvaluator]:
+        """Precompile a flag's targeting rules into a single closure.
 
-            if operator == "equals":
-                return attribute_value == rule.value
+        Reasons, attribute getters and per-rule predicates are resolved once
+        so evaluation only runs the comparisons. The config is not modified.
+        A rule edited in place is recompiled on its next evaluation; if the
+        targeting list itself is edited, the closure falls back to evaluating
+        the live rules.
 
-            elif operator == "not_equals":
-                return attribute_value != rule.value
-
-            elif operator == "in":
-                return rule.values is not None and attribute_value in rule.values
-
-            elif operator == "not_in":
-                return rule.values is None or attribute_value not in rule.values
-
-            elif operator == "contains":
-                return str(rule.value).lower() in str(attribute_value).lower()
-
-            elif operator == "not_contains":
-                return str(rule.value).lower() not in str(attribute_value).lower()
-
-            elif operator == "starts_with":
-                return str(attribute_value).lower().startswith(str(rule.value).lower())
+        Args:
+            flag_name: Name of the flag
+            config: Flag configuration
 
-            elif operator == "ends_with":
-                return str(attribute_value).lower().endswith(str(rule.value).lower())
+        Returns:
+            Targeting evaluator for the flag, or None if it has no rules
+        """
+        rules = config.targeting
+        if not rules:
+            return None
 
-            elif operator == "greater_than":
-                return float(attribute_value) > float(rule.value)  # type: ignore
+        rules = list(rules)
+        compiled = [_compile_rule(index, rule) for index, rule in enumerate(rules)]
+        logger = self.logger
+
+        def evaluate_targeting(context: EvaluationContext) -> Optional[tuple[bool, str, int]]:
+            # Rules replaced, added or removed since compiling: use the live list
+            if config.targeting != rules:
+                return self._evaluate_rules(flag_name, config.targeting, context)
+
+            for entry in compiled:
+                rule, revision, getter, predicate, reason, index = entry
+                if rule._revision != revision:
+                    # Rule fields assigned since compiling
+                    compiled[index] = _compile_rule(index, rule)
+                    rule, revision, getter, predicate, reason, index = compiled[index]
+
+                attribute_value = getter(context)
+                if attribute_value is None:
+                    continue
+
+                if predicate is None:
+                    logger.warn(f"Unknown operator: {rule.operator}")
+                    continue
+
+                try:
+                    matched = predicate(attribute_value)
+                except Exception as e:
+                    logger.error("Error evaluating rule", {"rule": repr(rule), "error": str(e)})
+                    continue
+
+                if matched:
+                    if is_debug_enabled(logger):
+                        logger.debug(f"Flag '{flag_name}' matched targeting rule #{index + 1}")
+                    return (rule.enabled, reason, index)
 
-            elif operator == "less_than":
-                return float(attribute_value) < float(rule.value)  # type: ignore
+            return None
 
-            elif operator == "greater_than_or_equal":
-                return float(attribute_value) >= float(rule.value)  # type: ignore
+        return evaluate_targeting
 
-            elif operator == "less_than_or_equal":
-                return float(attribute_value) <= float(rule.value)  # type: ignore
+    def _rule_matches(self, rule: TargetingRule, context: EvaluationContext) -> bool:
+        """Check if a targeting rule matches the context."""
+        attribute_value = self._get_attribute_value(rule.attribute, context)
 
-            elif operator == "matches_regex":
-                pattern = re.compile(str(rule.value))
-                return pattern.search(str(attribute_value)) is not None
+        # If attribute doesn't exist, rule doesn't match
+        if attribute_value is None:
+            return False
 
-            else:
-                self.logger.warn(f"Unknown operator: {operator}")
+        try:
+            code = rule._op_code
+            if code < 0:
+                self.logger.warn(f"Unknown operator: {rule.operator}")
                 return False
 
+            return OPERATOR_TABLE[code](rule, attribute_value)
+
         except Exception as e:
-            self.logger.error(f"Error evaluating rule", {"rule": rule.__dict__, "error": str(e)})
+            self.logger.error(f"Error evaluating rule", {"rule": repr(rule), "error": str(e)})
             return False
 
     def _get_attribute_value(
@@ -177,12 +467,9 @@ class FlagEvaluator:
     ) -> Optional[Union[str, int, float, bool]]:
         """Get attribute value from context."""
         # Check standard fields
-        if attribute == "userId":
-            return context.user_id
-        if attribute == "email":
-            return context.email
-        if attribute == "environment":
-            return context.environment
+        getter = STANDARD_ATTRIBUTES.get(attribute)
+        if getter is not None:
+            return getter(context)
 
         # Check custom attributes
         if context.custom_attributes:
@@ -192,43 +479,50 @@ class FlagEvaluator:
 
     def _evaluate_rollout(
         self, flag_name: str, config: FlagConfig, context: EvaluationContext
-    ) -> Optional[tuple[bool, str, int]]:
+    ) -> Optional[tuple[bool, str, Optional[int]]]:
         """Evaluate rollout percentage."""
-        if not config.rollout:
+        rollout = config.rollout
+        if not rollout:
             return None
 
+        percentage = rollout.percentage
+
+        # 0% and 100% are settled without hashing (mirrors Hasher.is_in_rollout)
+        if percentage <= 0:
+            return (False, f"Rollout {percentage}%", None)
+        if percentage >= 100:
+            return (True, f"Rollout {percentage}%", None)
+
         identifier = context.user_id or context.email or "anonymous"
-        seed = config.rollout.seed or context._hash_seed
+        seed = rollout.seed or context._hash_seed
         bucket = Hasher.get_bucket(flag_name, identifier, seed)
-        in_rollout = bucket < config.rollout.percentage
-
-        self.logger.debug(
-            f"Flag '{flag_name}' rollout evaluation",
-            {
-                "percentage": config.rollout.percentage,
-                "bucket": bucket,
-                "in_rollout": in_rollout,
-            },
-        )
+        in_rollout = bucket < percentage
+
+        if is_debug_enabled(self.logger):
+            self.logger.debug(
+                f"Flag '{flag_name}' rollout evaluation",
+                {
+                    "percentage": percentage,
+                    "bucket": bucket,
+                    "in_rollout": in_rollout,
+                },
+            )
 
-        return (
-            in_rollout,
-            f"Rollout {config.rollout.percentage}% (user bucket: {bucket})",
-            bucket,
-        )
+        return (in_rollout, f"Rollout {percentage}% (user bucket: {bucket})", bucket)
 
     def _create_result(
         self,
         flag_name: str,
         enabled: bool,
         reason: str,
-        start_time: float,
+        timestamp: float,
         matched_rule: Optional[int] = None,
         rollout_bucket: Optional[int] = None,
+        start_ns: Optional[int] = None,
     ) -> EvaluationResult:
         """Create evaluation result."""
         metadata = EvaluationMetadata(
-            timestamp=start_time,
+            timestamp=timestamp,
             matched_rule=matched_rule,
             rollout_bucket=rollout_bucket,
         )
@@ -240,13 +534,14 @@ class FlagEvaluator:
             metadata=metadata,
         )
 
-        self.logger.debug(
-            f"Flag '{flag_name}' evaluation complete",
-            {
-                "enabled": enabled,
-                "reason": reason,
-                "duration": time.time() - start_time,
-            },
-        )
+        if start_ns is not None:
+            self.logger.debug(
+                f"Flag '{flag_name}' evaluation complete",
+                {
+                    "enabled": enabled,
+                    "reason": reason,
+                    "duration": (time.perf_counter_ns() - start_ns) / 1e9,
+                },
+            )
 
         return result
@@ -1,13 +1,85 @@
 """Hash utilities for deterministic rollout distribution."""
 
 import hashlib
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional
+
+try:
+    import mmh3  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    mmh3 = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import xxhash  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None  # type: ignore[assignment, unused-ignore]
+
+BUCKET_CACHE_SIZE = 10000
+
+
+def _blake2b_32(data: bytes = b"") -> Any:
+    """32-bit BLAKE2b hash object."""
+    return hashlib.blake2b(data, digest_size=4)
+
+
+# Factories for hash objects; only the first 4 digest bytes are used
+HASH_ALGORITHMS: Dict[str, Callable[..., Any]] = {
+    "sha256": hashlib.sha256,
+    "blake2b": _blake2b_32,
+}
+
+if mmh3 is not None and hasattr(mmh3, "mmh3_32"):
+    HASH_ALGORITHMS["murmur3"] = mmh3.mmh3_32
+
+if xxhash is not None:
+    HASH_ALGORITHMS["xxhash"] = xxhash.xxh32
+
+
+@lru_cache(maxsize=1024)
+def _prefix_state(algorithm: str, seed: str, flag_name: str) -> Any:
+    """Hash object already fed with the ``seed:flag_name:`` prefix."""
+    return HASH_ALGORITHMS[algorithm](f"{seed}:{flag_name}:".encode())
+
+
+@lru_cache(maxsize=BUCKET_CACHE_SIZE)
+def _compute_bucket(algorithm: str, seed: str, flag_name: str, identifier: str) -> int:
+    """Compute the bucket for a resolved seed (cached, pure over its inputs)."""
+    # Resume from the cached prefix state instead of re-hashing the whole input
+    hasher = _prefix_state(algorithm, seed, flag_name).copy()
+    hasher.update(identifier.encode())
+    hash_number = int.from_bytes(hasher.digest()[:4], "big")
+
+    # Return bucket 0-99; keep the modulo mapping so buckets match the JS SDK
+    return hash_number % 100
 
 
 class Hasher:
     """Deterministic hash function for rollout distribution."""
 
-    DEFAULT_SEED = "devbolt"
+    DEFAULT_SEED: ClassVar[str] = "devbolt"
+
+    # SHA-256 keeps bucket assignments identical to the JS SDK
+    algorithm: ClassVar[str] = "sha256"
+
+    @staticmethod
+    def set_algorithm(algorithm: str) -> None:
+        """Select the hash algorithm used for bucket assignment.
+
+        Switching algorithms reassigns users to different buckets, so every
+        SDK evaluating the same flags should use the same algorithm.
+
+        Args:
+            algorithm: One of "sha256" (default), "blake2b", "murmur3" or "xxhash"
+
+        Raises:
+            ValueError: If the algorithm is unknown or its dependency is missing
+        """
+        if algorithm not in HASH_ALGORITHMS:
+            available = ", ".join(sorted(HASH_ALGORITHMS))
+            raise ValueError(f"Unsupported hash algorithm '{algorithm}' (available: {available})")
+
+        Hasher.algorithm = algorithm
+        Hasher.clear_cache()
 
     @staticmethod
     def get_bucket(flag_name: str, identifier: str, seed: Optional[str] = None) -> int:
@@ -21,14 +93,41 @@ class Hasher:
         Returns:
             Bucket number (0-99)
         """
-        hash_input = f"{seed or Hasher.DEFAULT_SEED}:{flag_name}:{identifier}"
-        hash_digest = hashlib.sha256(hash_input.encode()).hexdigest()
+        return _compute_bucket(Hasher.algorithm, seed or Hasher.DEFAULT_SEED, flag_name, identifier)
 
-        # Convert first 8 hex characters to number
-        hash_number = int(hash_digest[:8], 16)
+    @staticmethod
+    def get_buckets(
+        flag_name: str, identifiers: Iterable[str], seed: Optional[str] = None
+    ) -> List[int]:
+        """Generate hash buckets (0-99) for many identifiers of one flag.
+
+        Resolves the algorithm and seed prefix once for the whole batch and
+        skips the per-identifier cache, which a batch of distinct users
+        would only churn. Results match get_bucket for every identifier.
+
+        Args:
+            flag_name: Name of the flag
+            identifiers: User identifiers
+            seed: Optional custom seed
 
-        # Return bucket 0-99
-        return hash_number % 100
+        Returns:
+            Bucket numbers, in the order of identifiers
+        """
+        prefix = _prefix_state(Hasher.algorithm, seed or Hasher.DEFAULT_SEED, flag_name)
+        from_bytes = int.from_bytes
+
+        buckets: List[int] = []
+        for identifier in identifiers:
+            hasher = prefix.copy()
+            hasher.update(identifier.encode())
+            buckets.append(from_bytes(hasher.digest()[:4], "big") % 100)
+        return buckets
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear memoized bucket assignments."""
+        _compute_bucket.cache_clear()
+        _prefix_state.cache_clear()
 
     @staticmethod
     def is_in_rollout(
@@ -52,3 +151,23 @@ class Hasher:
 
         bucket = Hasher.get_bucket(flag_name, identifier, seed)
         return bucket < percentage
+
+    @staticmethod
+    def is_in_rollout_batch(
+        flag_name: str, identifiers: Iterable[str], percentage: float, seed: Optional[str] = None
+    ) -> List[bool]:
+        """Check many identifiers against one rollout percentage.
+
+        Args:
+            flag_name: Name of the flag
+            identifiers: User identifiers
+            percentage: Rollout percentage (0-100)
+            seed: Optional custom seed
+
+        Returns:
+            Rollout membership per identifier, in the order of identifiers
+        """
+        if percentage == 0 or percentage == 100:
+            return [percentage == 100 for _ in identifiers]
+
+        return [bucket < percentage for bucket in Hasher.get_buckets(flag_name, identifiers, seed)]
@@ -6,25 +6,43 @@ from typing import Any, Dict, Optional
 
 from .types import LogLevel, Logger
 
+try:
+    import orjson  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# Integer thresholds so level checks avoid enum attribute lookups
+_DEBUG = LogLevel.DEBUG.value
+_INFO = LogLevel.INFO.value
+_WARN = LogLevel.WARN.value
+_ERROR = LogLevel.ERROR.value
+
+
+def _dumps(meta: Dict[str, Any]) -> str:
+    """Serialize log metadata as compact JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(meta, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(meta, separators=(",", ":"), default=str)
+
+
+def _noop(message: str, meta: Optional[Dict[str, Any]] = None) -> None:
+    """Discard a log message."""
+
 
 class NoOpLogger:
     """Logger that does nothing."""
 
-    def debug(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
-        """Log debug message (no-op)."""
-        pass
+    is_debug = False
 
-    def info(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
-        """Log info message (no-op)."""
-        pass
+    debug = info = warn = error = staticmethod(_noop)
 
-    def warn(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
-        """Log warning message (no-op)."""
-        pass
 
-    def error(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
-        """Log error message (no-op)."""
-        pass
+NOOP_LOGGER = NoOpLogger()
+"""Shared no-op logger instance."""
 
 
 class ConsoleLogger:
@@ -38,31 +56,64 @@ class ConsoleLogger:
         """
         self.level = level
 
+    @property
+    def level(self) -> LogLevel:
+        """Minimum log level to output."""
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel) -> None:
+        self._level = level
+        self._threshold = level.value
+
+    @property
+    def is_debug(self) -> bool:
+        """Whether debug messages are output."""
+        return self._threshold <= _DEBUG
+
     def _format_meta(self, meta: Optional[Dict[str, Any]]) -> str:
-        """Format metadata for logging."""
+        """Format metadata for logging (compact, single line)."""
         if not meta:
             return ""
-        return " " + json.dumps(meta, indent=2)
+        return " " + _dumps(meta)
 
     def debug(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
         """Log debug message."""
-        if self.level.value <= LogLevel.DEBUG.value:
-            print(f"[DevBolt Debug] {message}{self._format_meta(meta)}", file=sys.stderr)
+        if self._threshold > _DEBUG:
+            return
+        print(f"[DevBolt Debug] {message}{self._format_meta(meta)}", file=sys.stderr)
 
     def info(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
         """Log info message."""
-        if self.level.value <= LogLevel.INFO.value:
-            print(f"[DevBolt] {message}{self._format_meta(meta)}", file=sys.stderr)
+        if self._threshold > _INFO:
+            return
+        print(f"[DevBolt] {message}{self._format_meta(meta)}", file=sys.stderr)
 
     def warn(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
         """Log warning message."""
-        if self.level.value <= LogLevel.WARN.value:
-            print(f"[DevBolt Warning] {message}{self._format_meta(meta)}", file=sys.stderr)
+        if self._threshold > _WARN:
+            return
+        print(f"[DevBolt Warning] {message}{self._format_meta(meta)}", file=sys.stderr)
 
     def error(self, message: str, meta: Optional[Dict[str, Any]] = None) -> None:
         """Log error message."""
-        if self.level.value <= LogLevel.ERROR.value:
-            print(f"[DevBolt Error] {message}{self._format_meta(meta)}", file=sys.stderr)
+        if self._threshold > _ERROR:
+            return
+        print(f"[DevBolt Error] {message}{self._format_meta(meta)}", file=sys.stderr)
+
+
+def is_debug_enabled(logger: Logger) -> bool:
+    """Check whether a logger outputs debug messages.
+
+    Loggers without an ``is_debug`` attribute are assumed to want them.
+
+    Args:
+        logger: Logger instance
+
+    Returns:
+        True if debug messages may be output
+    """
+    return bool(getattr(logger, "is_debug", True))
 
 
 def create_logger(level: LogLevel = LogLevel.WARN) -> Logger:
@@ -75,5 +126,5 @@ def create_logger(level: LogLevel = LogLevel.WARN) -> Logger:
         Logger instance
     """
     if level == LogLevel.NONE:
-        return NoOpLogger()
+        return NOOP_LOGGER
     return ConsoleLogger(level)
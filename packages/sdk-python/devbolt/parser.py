@@ -1,7 +1,11 @@
 """Configuration parser for DevBolt."""
 
-from pathlib import Path
-from typing import Any, Dict
+import copy
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import IO, Any, Dict, Hashable, Optional, Set, Tuple, Union
 
 import yaml
 
@@ -14,6 +18,41 @@ from .types import (
 )
 from .validator import ConfigValidator
 
+# libyaml's C loader is much faster; fall back to the pure-Python loader
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CONTENT_CACHE_SIZE = 16
+
+# Parsed configs keyed by BLAKE2b digest of the YAML content, least recently used first
+_content_cache: "OrderedDict[bytes, FlagsConfig]" = OrderedDict()
+
+# File watchers and request threads parse concurrently
+_cache_lock = threading.Lock()
+
+
+def content_digest(data: bytes) -> bytes:
+    """Digest identifying config file content, shared with the file watcher."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _cache_get(cache: "OrderedDict[Any, FlagsConfig]", key: Hashable) -> Optional[FlagsConfig]:
+    """Look up a cached config, marking it most recently used."""
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+    return cached
+
+
+def _cache_put(
+    cache: "OrderedDict[Any, FlagsConfig]", key: Hashable, config: FlagsConfig, max_size: int
+) -> None:
+    """Store a config, evicting the least recently used entry when full."""
+    with _cache_lock:
+        cache[key] = config
+        if len(cache) > max_size:
+            cache.popitem(last=False)
+
 
 class ConfigParser:
     """Parses and validates feature flag configurations."""
@@ -22,6 +61,9 @@ class ConfigParser:
     def parse_yaml(content: str) -> FlagsConfig:
         """Parse YAML string into config.
 
+        Content that was parsed before is served from an in-process cache.
+        Each call returns its own copy, so callers may modify the result.
+
         Args:
             content: YAML content as string
 
@@ -33,25 +75,30 @@ class ConfigParser:
             ValidationError: If validation fails
         """
         try:
-            parsed = yaml.safe_load(content)
+            encoded = content.encode()
+        except UnicodeEncodeError as e:
+            # Lone surrogates cannot be valid YAML text
+            raise ConfigParseError(f"Failed to parse YAML: {str(e)}", e) from e
 
-            if not isinstance(parsed, dict):
-                raise ConfigParseError("Config must be a YAML object")
+        content_key = content_digest(encoded)
+        cached = _cache_get(_content_cache, content_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
-            ConfigValidator.validate(parsed)
-            return ConfigParser._convert_to_dataclasses(parsed)
+        config = ConfigParser._load(content)
 
-        except yaml.YAMLError as e:
-            raise ConfigParseError(f"Failed to parse YAML: {str(e)}", e)
-        except Exception as e:
-            if isinstance(e, ConfigParseError):
-                raise
-            raise ConfigParseError(f"Failed to parse config: {str(e)}", e)
+        _cache_put(_content_cache, content_key, config, CONTENT_CACHE_SIZE)
+        return copy.deepcopy(config)
 
     @staticmethod
     def parse_file(file_path: str) -> FlagsConfig:
         """Parse config from file.
 
+        The file is always read, and content that was parsed before is
+        served from the in-process content cache. File metadata is not
+        trusted, so an edit that keeps the size and mtime is still seen.
+        Each call returns its own copy, so callers may modify the result.
+
         Args:
             file_path: Path to config file
 
@@ -59,32 +106,148 @@ class ConfigParser:
             Validated flags configuration
 
         Raises:
-            ConfigParseError: If parsing fails
+            ConfigParseError: If the file cannot be read or parsed
+            ValidationError: If validation fails
+        """
+        return ConfigParser.parse_file_with_digest(file_path)[0]
+
+    @staticmethod
+    def parse_file_with_digest(file_path: str) -> Tuple[FlagsConfig, bytes]:
+        """Parse config from file, also returning the digest of the bytes parsed.
+
+        Same as parse_file. The digest lets a file watcher compare later
+        contents against exactly what was loaded.
+
+        Args:
+            file_path: Path to config file
+
+        Returns:
+            Validated flags configuration and the content_digest of the file
+
+        Raises:
+            ConfigParseError: If the file cannot be read or parsed
+            ValidationError: If validation fails
         """
         try:
-            path = Path(file_path)
-            content = path.read_text(encoding="utf-8")
-            return ConfigParser.parse_yaml(content)
+            with open(file_path, "rb") as stream:
+                data = stream.read()
+
+            content_key = content_digest(data)
+            config = _cache_get(_content_cache, content_key)
+            if config is None:
+                # Hand libyaml the raw bytes so it decodes in C, without
+                # building the whole file as a Python str first
+                config = ConfigParser._load(data)
+                _cache_put(_content_cache, content_key, config, CONTENT_CACHE_SIZE)
+
+            return copy.deepcopy(config), content_key
 
         except FileNotFoundError:
-            raise ConfigParseError(f"Config file not found: {file_path}")
-        except Exception as e:
-            if isinstance(e, ConfigParseError):
-                raise
-            raise ConfigParseError(f"Failed to read config file: {str(e)}", e)
+            raise ConfigParseError(f"Config file not found: {file_path}") from None
+        except OSError as e:
+            raise ConfigParseError(f"Failed to read config file: {str(e)}", e) from e
+
+    @staticmethod
+    def peek_flag_names(file_path: str) -> Set[str]:
+        """Read the top-level flag names of a config file.
+
+        Walks the YAML event stream and collects the root mapping's keys
+        without building the document or validating flags.
+
+        Args:
+            file_path: Path to config file
+
+        Returns:
+            Set of flag names
+
+        Raises:
+            ConfigParseError: If the file cannot be read or is not a YAML object
+        """
+        names: Set[str] = set()
+        depth = 0
+        expect_key = True
+        found_root = False
+
+        try:
+            with open(file_path, "rb") as stream:
+                for event in yaml.parse(stream, Loader=_YamlLoader):
+                    if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                        if depth == 0:
+                            if not isinstance(event, yaml.MappingStartEvent):
+                                raise ConfigParseError("Config must be a YAML object")
+                            found_root = True
+                        elif depth == 1:
+                            expect_key = True
+                        depth += 1
+                    elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                        depth -= 1
+                        if depth == 0:
+                            break
+                    elif isinstance(event, (yaml.ScalarEvent, yaml.AliasEvent)):
+                        if depth == 0:
+                            raise ConfigParseError("Config must be a YAML object")
+                        if depth == 1:
+                            if expect_key and isinstance(event, yaml.ScalarEvent):
+                                names.add(event.value)
+                            expect_key = not expect_key
+        except FileNotFoundError:
+            raise ConfigParseError(f"Config file not found: {file_path}") from None
+        except OSError as e:
+            raise ConfigParseError(f"Failed to read config file: {str(e)}", e) from e
+        except yaml.YAMLError as e:
+            raise ConfigParseError(f"Failed to parse YAML: {str(e)}", e) from e
+
+        if not found_root:
+            raise ConfigParseError("Config must be a YAML object")
+        return names
+
+    @staticmethod
+    def _load(stream: Union[str, bytes, IO[bytes]]) -> FlagsConfig:
+        """Load YAML from a string, bytes or binary stream and build the config.
+
+        Args:
+            stream: YAML content, raw file bytes or open binary file
+
+        Returns:
+            Validated flags configuration
+
+        Raises:
+            ConfigParseError: If the YAML is malformed or not an object
+            ValidationError: If validation fails
+        """
+        try:
+            parsed = yaml.load(stream, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise ConfigParseError(f"Failed to parse YAML: {str(e)}", e) from e
+
+        if not isinstance(parsed, dict):
+            raise ConfigParseError("Config must be a YAML object")
+
+        return ConfigValidator.build(parsed)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the parsed content cache."""
+        with _cache_lock:
+            _content_cache.clear()
 
     @staticmethod
     def _convert_to_dataclasses(parsed: Dict[str, Any]) -> FlagsConfig:
-        """Convert parsed dict to dataclass instances."""
+        """Convert parsed dict to dataclass instances.
+
+        Deprecated: parsing now validates and builds in one pass through
+        ConfigValidator.build. Kept for callers holding pre-validated dicts.
+        """
         config: FlagsConfig = {}
+        intern = sys.intern
 
         for flag_name, flag_data in parsed.items():
+            rollout_data = flag_data.get("rollout")
+            targeting_data = flag_data.get("targeting")
 
             rollout = None
-            if "rollout" in flag_data and flag_data["rollout"]:
-                rollout_data = flag_data["rollout"]
-
-                if isinstance(rollout_data, RolloutConfig):
+            if rollout_data:
+                if type(rollout_data) is RolloutConfig:
                     rollout = rollout_data
                 elif isinstance(rollout_data, dict):
                     rollout = RolloutConfig(
@@ -93,26 +256,27 @@ class ConfigParser:
                     )
 
             targeting = None
-            if "targeting" in flag_data and flag_data["targeting"]:
+            if targeting_data:
                 targeting = []
-                for rule in flag_data["targeting"]:
+                for rule in targeting_data:
 
-                    if isinstance(rule, TargetingRule):
+                    if type(rule) is TargetingRule:
                         targeting.append(rule)
                     elif isinstance(rule, dict):
+                        get = rule.get
                         targeting.append(
                             TargetingRule(
                                 attribute=rule["attribute"],
                                 operator=rule["operator"],
                                 enabled=rule["enabled"],
-                                value=rule.get("value"),
-                                values=rule.get("values"),
-                                description=rule.get("description"),
+                                value=get("value"),
+                                values=get("values"),
+                                description=get("description"),
                             )
                         )
 
             # Create flag config
-            config[flag_name] = FlagConfig(
+            config[intern(flag_name)] = FlagConfig(
                 enabled=flag_data["enabled"],
                 description=flag_data.get("description"),
                 rollout=rollout,
@@ -1,8 +1,27 @@
 """Type definitions for DevBolt feature flags."""
 
+import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Protocol, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a per-instance __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Targeting operators
 TargetingOperator = Literal[
@@ -37,6 +56,43 @@ TARGETING_OPERATORS: List[TargetingOperator] = [
     "matches_regex",
 ]
 
+# Set form of TARGETING_OPERATORS for O(1) membership checks
+TARGETING_OPERATOR_SET: FrozenSet[str] = frozenset(TARGETING_OPERATORS)
+
+# Integer opcode per operator (its index in TARGETING_OPERATORS)
+OPERATOR_CODES: Dict[str, int] = {
+    operator: code for code, operator in enumerate(TARGETING_OPERATORS)
+}
+
+
+@lru_cache(maxsize=512)
+def compile_regex(pattern: str) -> Pattern[str]:
+    """Compile a targeting regex, reusing patterns seen before.
+
+    Shared by validation and TargetingRule so each pattern is compiled once.
+    """
+    return re.compile(pattern)
+
+
+# Operators comparing lowercased string forms
+STRING_OPERATORS: FrozenSet[str] = frozenset(
+    {"contains", "not_contains", "starts_with", "ends_with"}
+)
+
+# Operators taking a 'values' list instead of a single 'value'
+LIST_OPERATORS: FrozenSet[str] = frozenset({"in", "not_in"})
+
+# Public TargetingRule fields
+RULE_FIELDS: FrozenSet[str] = frozenset(
+    {"attribute", "operator", "enabled", "value", "values", "description"}
+)
+
+# TargetingRule fields the precomputed matcher state is derived from
+RULE_STATE_FIELDS: FrozenSet[str] = frozenset({"operator", "value", "values"})
+
+# TargetingRule string fields stored interned
+_INTERNED_RULE_FIELDS: FrozenSet[str] = frozenset({"attribute", "operator"})
+
 
 class LogLevel(Enum):
     """Log levels for the logger."""
@@ -68,11 +124,11 @@ class Logger(Protocol):
         ...
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RolloutConfig:
     """Rollout configuration for percentage-based distribution."""
 
-    percentage: float
+    percentage: Union[int, float]
     seed: Optional[str] = None
 
     def __post_init__(self) -> None:
@@ -81,31 +137,99 @@ class RolloutConfig:
             raise ValueError("Rollout percentage must be between 0 and 100")
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TargetingRule:
-    """Targeting rule for conditional flag evaluation."""
+    """Targeting rule for conditional flag evaluation.
+
+    Matcher state is precomputed from operator, value and values, and is
+    recomputed whenever one of them is assigned. values is stored as a
+    tuple, so edit it by assigning a new sequence. Every field assignment
+    after construction bumps _revision, which compiled targeting checks.
+    """
 
     attribute: str
     operator: TargetingOperator
     enabled: bool
     value: Optional[Union[str, int, float, bool]] = None
-    values: Optional[List[Union[str, int, float, bool]]] = None
+    values: Optional[Sequence[Union[str, int, float, bool]]] = None
     description: Optional[str] = None
+    _compiled_regex: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _value_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _values_set: Optional[FrozenSet[Union[str, int, float, bool]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _op_code: int = field(default=-1, init=False, repr=False, compare=False)
+    # 0 while constructing; then counts field assignments, starting from 1
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign a field, refreshing matcher state derived from it."""
+        if name == "values" and isinstance(value, list):
+            value = tuple(value)
+        elif name in _INTERNED_RULE_FIELDS and isinstance(value, str):
+            # Interned strings make attribute and operator lookups identity hits
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+
+        revision = getattr(self, "_revision", 0)
+        if revision and name in RULE_FIELDS:
+            if name in RULE_STATE_FIELDS:
+                self._refresh_state()
+            object.__setattr__(self, "_revision", revision + 1)
 
     def __post_init__(self) -> None:
-        """Validate targeting rule."""
-        if self.operator not in TARGETING_OPERATORS:
-            raise ValueError(f"Invalid operator: {self.operator}")
+        """Validate targeting rule and precompile its matcher state."""
+        operator = self.operator
+        if not isinstance(operator, str) or operator not in OPERATOR_CODES:
+            raise ValueError(f"Invalid operator: {operator}")
 
-        if self.operator in ("in", "not_in"):
+        value = self.value
+        if operator in LIST_OPERATORS:
             if not self.values:
-                raise ValueError(f"Operator '{self.operator}' requires 'values'")
-        else:
-            if self.value is None:
-                raise ValueError(f"Operator '{self.operator}' requires 'value'")
-
-
-@dataclass
+                raise ValueError(f"Operator '{operator}' requires 'values'")
+        elif value is None:
+            raise ValueError(f"Operator '{operator}' requires 'value'")
+
+        if operator == "matches_regex":
+            try:
+                compile_regex(str(value))
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {value}") from e
+
+        self._refresh_state()
+        self._revision = 1
+
+    def _refresh_state(self) -> None:
+        """Recompute the opcode, lowercased value, values set and regex from the current fields."""
+        operator = self.operator
+        code = OPERATOR_CODES.get(operator) if isinstance(operator, str) else None
+        # Unknown operators assigned after construction are reported at evaluation
+        self._op_code = -1 if code is None else code
+        self._value_lower = str(self.value).lower() if operator in STRING_OPERATORS else None
+
+        regex = None
+        if operator == "matches_regex":
+            try:
+                regex = compile_regex(str(self.value))
+            except re.error:
+                # Assigned an invalid pattern after construction: the rule stops matching
+                pass
+        self._compiled_regex = regex
+
+        values = self.values
+        values_set = None
+        if values is not None:
+            try:
+                values_set = frozenset(values)
+            except TypeError:
+                # Unhashable values fall back to sequence membership
+                pass
+        self._values_set = values_set
+
+
+@dataclass(**_SLOTS)
 class FlagConfig:
     """Feature flag configuration."""
 
@@ -119,8 +243,11 @@ class FlagConfig:
 
 FlagsConfig = Dict[str, FlagConfig]
 
+# Precompiled targeting: returns (enabled, reason, rule index) for the first matching rule
+TargetingEvaluator = Callable[["EvaluationContext"], Optional[Tuple[bool, str, int]]]
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationContext:
     """Context for flag evaluation."""
 
@@ -131,7 +258,7 @@ class EvaluationContext:
     _hash_seed: Optional[str] = None  # Internal testing use only
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationMetadata:
     """Metadata about flag evaluation."""
 
@@ -141,7 +268,7 @@ class EvaluationMetadata:
     variant: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationResult:
     """Result of flag evaluation."""
 
@@ -1,21 +1,31 @@
 """Configuration validator for DevBolt."""
 
 import re
-from typing import Any, Dict
+import string
+import sys
+from typing import Any, Callable, Dict, List, Optional
 
 from .types import (
-    TARGETING_OPERATORS,
+    LIST_OPERATORS,
+    TARGETING_OPERATOR_SET,
     FlagConfig,
     FlagsConfig,
     RolloutConfig,
     TargetingRule,
     ValidationError,
+    compile_regex,
 )
 
 MAX_FLAG_NAME_LENGTH = 100
 MAX_DESCRIPTION_LENGTH = 500
 FLAG_NAME_REGEX = re.compile(r"^[a-z0-9_-]+$")
 
+# Same character class as FLAG_NAME_REGEX, checked without the regex engine
+FLAG_NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "_-")
+
+# Sentinel telling an absent optional key apart from an explicit null
+_MISSING: Any = object()
+
 
 class ConfigValidator:
     """Validates feature flag configurations."""
@@ -27,15 +37,35 @@ class ConfigValidator:
         Args:
             config: Configuration to validate
 
+        Raises:
+            ValidationError: If configuration is invalid
+        """
+        ConfigValidator.build(config)
+
+    @staticmethod
+    def build(config: Any) -> FlagsConfig:
+        """Validate configuration and build dataclasses in a single pass.
+
+        Args:
+            config: Configuration to validate
+
+        Returns:
+            Validated flags configuration
+
         Raises:
             ValidationError: If configuration is invalid
         """
         if not isinstance(config, dict):
             raise ValidationError("Config must be a dictionary")
 
+        flags: FlagsConfig = {}
         for flag_name, flag_config in config.items():
             ConfigValidator._validate_flag_name(flag_name)
-            ConfigValidator._validate_flag_config(flag_name, flag_config)
+            # Interned names make flag lookups identity hits
+            flag_name = sys.intern(flag_name)
+            flags[flag_name] = ConfigValidator._validate_flag_config(flag_name, flag_config)
+
+        return flags
 
     @staticmethod
     def _validate_flag_name(name: str) -> None:
@@ -43,51 +73,83 @@ class ConfigValidator:
         if not isinstance(name, str) or not name:
             raise ValidationError("Flag name must be a non-empty string", "flagName", name)
 
-        if not FLAG_NAME_REGEX.match(name):
+        # Length first, so oversized names are rejected without scanning them
+        if len(name) > MAX_FLAG_NAME_LENGTH:
             raise ValidationError(
-                f"Flag name '{name}' must contain only lowercase letters, numbers, underscores, and hyphens",
+                f"Flag name '{name}' exceeds maximum length of {MAX_FLAG_NAME_LENGTH}",
                 "flagName",
                 name,
             )
 
-        if len(name) > MAX_FLAG_NAME_LENGTH:
+        if not FLAG_NAME_CHARS.issuperset(name):
             raise ValidationError(
-                f"Flag name '{name}' exceeds maximum length of {MAX_FLAG_NAME_LENGTH}",
+                f"Flag name '{name}' must contain only lowercase letters, numbers, underscores, and hyphens",
                 "flagName",
                 name,
             )
 
     @staticmethod
-    def _validate_flag_config(flag_name: str, config: Any) -> None:
-        """Validate flag configuration structure."""
+    def _validate_flag_config(flag_name: str, config: Any) -> FlagConfig:
+        """Validate flag configuration structure and build it."""
         if not isinstance(config, dict):
             raise ValidationError(
                 f"Flag '{flag_name}': config must be a dictionary", flag_name, config
             )
 
         # Validate required 'enabled' field
-        if "enabled" not in config or not isinstance(config["enabled"], bool):
+        enabled = config.get("enabled")
+        if not isinstance(enabled, bool):
             raise ValidationError(
                 f"Flag '{flag_name}': 'enabled' must be a boolean",
                 f"{flag_name}.enabled",
-                config.get("enabled"),
+                enabled,
             )
 
-        # Validate optional fields
-        if "description" in config:
-            ConfigValidator._validate_description(flag_name, config["description"])
-
-        if "rollout" in config:
-            ConfigValidator._validate_rollout(flag_name, config["rollout"])
+        # Plain on/off flags have nothing else to validate
+        if len(config) == 1:
+            return FlagConfig(enabled=enabled)
 
-        if "targeting" in config:
-            ConfigValidator._validate_targeting(flag_name, config["targeting"])
+        # Validate optional fields, fetching each key once
+        description = config.get("description", _MISSING)
+        if description is not _MISSING:
+            ConfigValidator._validate_description(flag_name, description)
+        else:
+            description = None
+
+        rollout = config.get("rollout", _MISSING)
+        rollout = (
+            ConfigValidator._validate_rollout(flag_name, rollout)
+            if rollout is not _MISSING
+            else None
+        )
+
+        targeting = config.get("targeting", _MISSING)
+        targeting = (
+            ConfigValidator._validate_targeting(flag_name, targeting)
+            if targeting is not _MISSING
+            else None
+        )
+
+        environments = config.get("environments", _MISSING)
+        if environments is not _MISSING:
+            environments = ConfigValidator._validate_environments(flag_name, environments)
+        else:
+            environments = None
 
-        if "environments" in config:
-            ConfigValidator._validate_environments(flag_name, config["environments"])
+        metadata = config.get("metadata", _MISSING)
+        if metadata is not _MISSING:
+            ConfigValidator._validate_metadata(flag_name, metadata)
+        else:
+            metadata = None
 
-        if "metadata" in config:
-            ConfigValidator._validate_metadata(flag_name, config["metadata"])
+        return FlagConfig(
+            enabled=enabled,
+            description=description,
+            rollout=rollout,
+            targeting=targeting,
+            environments=environments,
+            metadata=metadata,
+        )
 
     @staticmethod
     def _validate_description(flag_name: str, description: Any) -> None:
@@ -107,8 +169,8 @@ class ConfigValidator:
             )
 
     @staticmethod
-    def _validate_rollout(flag_name: str, rollout: Any) -> None:
-        """Validate rollout configuration."""
+    def _validate_rollout(flag_name: str, rollout: Any) -> RolloutConfig:
+        """Validate rollout configuration and build it."""
         if not isinstance(rollout, dict):
             raise ValidationError(
                 f"Flag '{flag_name}': rollout must be a dictionary",
@@ -131,16 +193,21 @@ class ConfigValidator:
                 percentage,
             )
 
-        if "seed" in rollout and not isinstance(rollout["seed"], str):
+        seed = rollout.get("seed", _MISSING)
+        if seed is _MISSING:
+            seed = None
+        elif not isinstance(seed, str):
             raise ValidationError(
                 f"Flag '{flag_name}': rollout.seed must be a string",
                 f"{flag_name}.rollout.seed",
-                rollout["seed"],
+                seed,
             )
 
+        return RolloutConfig(percentage=percentage, seed=seed)
+
     @staticmethod
-    def _validate_targeting(flag_name: str, targeting: Any) -> None:
-        """Validate targeting rules."""
+    def _validate_targeting(flag_name: str, targeting: Any) -> Optional[List[TargetingRule]]:
+        """Validate targeting rules and build them (None when empty)."""
         if not isinstance(targeting, list):
             raise ValidationError(
                 f"Flag '{flag_name}': targeting must be a list",
@@ -148,12 +215,15 @@ class ConfigValidator:
                 targeting,
             )
 
-        for index, rule in enumerate(targeting):
+        rules = [
             ConfigValidator._validate_targeting_rule(flag_name, rule, index)
+            for index, rule in enumerate(targeting)
+        ]
+        return rules or None
 
     @staticmethod
-    def _validate_targeting_rule(flag_name: str, rule: Any, index: int) -> None:
-        """Validate single targeting rule."""
+    def _validate_targeting_rule(flag_name: str, rule: Any, index: int) -> TargetingRule:
+        """Validate single targeting rule and build it."""
         if not isinstance(rule, dict):
             raise ValidationError(
                 f"Flag '{flag_name}': targeting rule {index} must be a dictionary",
@@ -176,30 +246,18 @@ class ConfigValidator:
             )
 
         # Validate operator
-        if "operator" not in rule or rule["operator"] not in TARGETING_OPERATORS:
+        operator = rule.get("operator")
+        if not isinstance(operator, str) or operator not in TARGETING_OPERATOR_SET:
             raise ValidationError(
-                f"Flag '{flag_name}': targeting rule {index} has invalid operator '{rule.get('operator')}'",
+                f"Flag '{flag_name}': targeting rule {index} has invalid operator '{operator}'",
                 f"{rule_key}.operator",
-                rule.get("operator"),
+                operator,
             )
 
-        operator = rule["operator"]
-
         # Validate value/values based on operator
-        if operator in ("in", "not_in"):
-            if "values" not in rule or not isinstance(rule["values"], list) or not rule["values"]:
-                raise ValidationError(
-                    f"Flag '{flag_name}': targeting rule {index} with operator '{operator}' requires non-empty 'values' list",
-                    f"{rule_key}.values",
-                    rule.get("values"),
-                )
-        else:
-            if "value" not in rule:
-                raise ValidationError(
-                    f"Flag '{flag_name}': targeting rule {index} with operator '{operator}' requires 'value' field",
-                    f"{rule_key}.value",
-                    None,
-                )
+        _RULE_VALUE_VALIDATORS.get(operator, ConfigValidator._validate_rule_value)(
+            flag_name, rule, index, operator
+        )
 
         # Validate enabled
         if "enabled" not in rule or not isinstance(rule["enabled"], bool):
@@ -209,20 +267,58 @@ class ConfigValidator:
                 rule.get("enabled"),
             )
 
-        # Validate regex if operator is matches_regex
-        if operator == "matches_regex":
-            try:
-                re.compile(str(rule["value"]))
-            except re.error:
-                raise ValidationError(
-                    f"Flag '{flag_name}': targeting rule {index} has invalid regex pattern",
-                    f"{rule_key}.value",
-                    rule["value"],
-                )
+        return TargetingRule(
+            attribute=rule["attribute"],
+            operator=rule["operator"],
+            enabled=rule["enabled"],
+            value=rule.get("value"),
+            values=rule.get("values"),
+            description=rule.get("description"),
+        )
+
+    @staticmethod
+    def _validate_rule_values(
+        flag_name: str, rule: Dict[str, Any], index: int, operator: str
+    ) -> None:
+        """Validate the 'values' list of an in/not_in rule."""
+        values = rule.get("values")
+        if not isinstance(values, list) or not values:
+            raise ValidationError(
+                f"Flag '{flag_name}': targeting rule {index} with operator '{operator}' requires non-empty 'values' list",
+                f"{flag_name}.targeting[{index}].values",
+                values,
+            )
 
     @staticmethod
-    def _validate_environments(flag_name: str, environments: Any) -> None:
-        """Validate environments configuration."""
+    def _validate_rule_value(
+        flag_name: str, rule: Dict[str, Any], index: int, operator: str
+    ) -> None:
+        """Validate the 'value' of a single-value rule."""
+        if rule.get("value") is None:
+            raise ValidationError(
+                f"Flag '{flag_name}': targeting rule {index} with operator '{operator}' requires 'value' field",
+                f"{flag_name}.targeting[{index}].value",
+                None,
+            )
+
+    @staticmethod
+    def _validate_rule_regex(
+        flag_name: str, rule: Dict[str, Any], index: int, operator: str
+    ) -> None:
+        """Validate the 'value' of a matches_regex rule is a valid pattern."""
+        ConfigValidator._validate_rule_value(flag_name, rule, index, operator)
+        try:
+            compile_regex(str(rule["value"]))
+        except re.error:
+            raise ValidationError(
+                f"Flag '{flag_name}': targeting rule {index} has invalid regex pattern",
+                f"{flag_name}.targeting[{index}].value",
+                rule["value"],
+            )
+
+    @staticmethod
+    def _validate_environments(flag_name: str, environments: Any) -> Dict[str, bool]:
+        """Validate environments configuration and intern its names."""
         if not isinstance(environments, dict):
             raise ValidationError(
                 f"Flag '{flag_name}': environments must be a dictionary",
@@ -238,6 +334,12 @@ class ConfigValidator:
                     enabled,
                 )
 
+        # Interned names let the per-evaluation override lookup hit on identity
+        return {
+            sys.intern(env) if isinstance(env, str) else env: enabled
+            for env, enabled in environments.items()
+        }
+
     @staticmethod
     def _validate_metadata(flag_name: str, metadata: Any) -> None:
         """Validate metadata."""
@@ -247,3 +349,10 @@ class ConfigValidator:
                 f"{flag_name}.metadata",
                 metadata,
             )
+
+
+# Value checks for operators that differ from the single-'value' default
+_RULE_VALUE_VALIDATORS: Dict[str, Callable[[str, Dict[str, Any], int, str], None]] = {
+    **dict.fromkeys(LIST_OPERATORS, ConfigValidator._validate_rule_values),
+    "matches_regex": ConfigValidator._validate_rule_regex,
+}
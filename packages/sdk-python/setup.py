@@ -1,6 +1,15 @@
 """Setup script for DevBolt Python SDK."""
 
+import os
+
 from setuptools import setup
 
-# Use pyproject.toml for configuration
-setup()
+# Use pyproject.toml for configuration.
+# Set DEVBOLT_MYPYC=1 (with mypy installed) to compile the evaluation hot path to C.
+ext_modules = []
+if os.environ.get("DEVBOLT_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["devbolt/evaluator.py", "devbolt/hasher.py"])
+
+setup(ext_modules=ext_modules)
@@ -6,13 +6,7 @@ from typing import Generator
 
 import pytest
 
-
-@pytest.fixture
-def temp_config_file() -> Generator[str, None, None]:
-    """Create a temporary config file."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(
-            """
+TEST_CONFIG_YAML = """
 test_flag:
   enabled: true
   description: "Test flag"
@@ -40,25 +34,38 @@ env_flag:
     staging: true
     development: true
 """
-        )
-        config_path = f.name
 
-    yield config_path
+SIMPLE_CONFIG_YAML = """
+simple_flag:
+  enabled: true
+"""
 
-    # Cleanup
-    Path(config_path).unlink(missing_ok=True)
+
+@pytest.fixture(scope="session")
+def test_config_yaml() -> str:
+    """YAML content of the shared test config."""
+    return TEST_CONFIG_YAML
+
+
+@pytest.fixture(scope="session")
+def simple_config_yaml() -> str:
+    """YAML content of the simple config."""
+    return SIMPLE_CONFIG_YAML
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a config file shared by every test that only reads it."""
+    config_path = tmp_path_factory.mktemp("config") / "devbolt.yml"
+    config_path.write_text(TEST_CONFIG_YAML)
+    return str(config_path)
 
 
 @pytest.fixture
 def simple_config_file() -> Generator[str, None, None]:
-    """Create a simple config file."""
+    """Create a simple config file that tests may modify."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".yml", delete=False) as f:
-        f.write(
-            """
-simple_flag:
-  enabled: true
-"""
-        )
+        f.write(SIMPLE_CONFIG_YAML)
         config_path = f.name
 
     yield config_path
@@ -4,8 +4,11 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from watchdog.events import FileModifiedEvent
 
 from devbolt import DevBoltClient, EvaluationContext, LogLevel
+from devbolt import client as client_module
+from devbolt.client import ConfigFileHandler
 
 
 def test_client_initialization():
@@ -107,3 +110,133 @@ existing_flag:
 
     finally:
         Path(config_path).unlink()
+
+
+def test_file_handler_skips_unchanged_content(simple_config_file):
+    """Test file events only trigger reload when contents change."""
+    calls = []
+    handler = ConfigFileHandler(simple_config_file, lambda: calls.append(1))
+
+    # Same content as at startup
+    handler.on_modified(FileModifiedEvent(simple_config_file))
+    assert calls == []
+
+    Path(simple_config_file).write_text("simple_flag:\n  enabled: false\n")
+    handler.on_modified(FileModifiedEvent(simple_config_file))
+    handler.on_modified(FileModifiedEvent(simple_config_file))
+    assert calls == [1]
+
+
+def test_file_watcher_seeded_with_loaded_content(simple_config_file, monkeypatch):
+    """Test an edit between loading and starting the watcher still reloads."""
+    handlers = []
+
+    class EditingHandler(client_module.ConfigFileHandler):
+        def __init__(self, *args):
+            # The file changes after the initial load, before the watcher exists
+            Path(simple_config_file).write_text("simple_flag:\n  enabled: false\n")
+            super().__init__(*args)
+            handlers.append(self)
+
+    monkeypatch.setattr(client_module, "ConfigFileHandler", EditingHandler)
+    client = DevBoltClient(config_path=simple_config_file, logger=LogLevel.NONE)
+    try:
+        assert client.is_enabled("simple_flag") is True
+
+        handlers[0].on_modified(FileModifiedEvent(client.config_path))
+        assert client.is_enabled("simple_flag") is False
+    finally:
+        client.destroy()
+
+
+def test_context_merge(simple_config_file):
+    """Test contexts are merged over the default context."""
+    client = DevBoltClient(
+        config_path=simple_config_file,
+        auto_reload=False,
+        logger=LogLevel.NONE,
+        default_context=EvaluationContext(custom_attributes={"plan": "free", "region": "eu"}),
+    )
+    context = EvaluationContext(user_id="user-1", custom_attributes={"plan": "pro"})
+
+    merged = client._merge_context(context)
+    assert merged.user_id == "user-1"
+    assert merged.custom_attributes == {"plan": "pro", "region": "eu"}
+
+    assert client._merge_context(None) is client.default_context
+
+    client.default_context = EvaluationContext()
+    assert client._merge_context(context) is context
+
+    client.destroy()
+
+
+def test_evaluation_scope(temp_config_file):
+    """Test scoped evaluation reuses the merged context."""
+    seen = []
+    client = DevBoltClient(
+        config_path=temp_config_file,
+        auto_reload=False,
+        logger=LogLevel.NONE,
+        default_context=EvaluationContext(custom_attributes={"plan": "pro"}),
+        on_flag_evaluated=lambda result, context: seen.append(context),
+    )
+
+    scope = client.scope(EvaluationContext(email="jo@company.com"))
+    assert scope.is_enabled("targeted_flag") is True
+    assert scope.evaluate("disabled_flag").enabled is False
+
+    assert seen[0] is seen[1] is scope.context
+    assert scope.context.custom_attributes == {"plan": "pro"}
+
+    client.destroy()
+
+
+def test_evaluate_many(temp_config_file):
+    """Test client batch evaluation."""
+    client = DevBoltClient(config_path=temp_config_file, auto_reload=False, logger=LogLevel.NONE)
+
+    results = client.evaluate_many(["test_flag", "disabled_flag"])
+    assert {name: result.enabled for name, result in results.items()} == {
+        "test_flag": True,
+        "disabled_flag": False,
+    }
+    assert set(client.evaluate_many()) == set(client.get_all_flags())
+
+    client.destroy()
+
+
+def test_uninitialized_client_uses_fallbacks():
+    """Test fallbacks are used when the config cannot be loaded."""
+    client = DevBoltClient(
+        config_path="/nonexistent/flags.yml",
+        auto_reload=False,
+        logger=LogLevel.NONE,
+        fallbacks={"new_feature": True},
+    )
+
+    assert client.is_initialized() is False
+    assert client.is_enabled("new_feature") is True
+    assert client.is_enabled("other_feature") is False
+
+    result = client.evaluate("new_feature")
+    assert result.enabled is True
+    assert result.reason == "Client not initialized, using fallback"
+
+
+def test_find_default_config_path(tmp_path, monkeypatch):
+    """Test default locations are searched in order."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "devbolt.yml").write_text("root_flag:\n  enabled: true\n")
+
+    client = DevBoltClient(auto_reload=False, logger=LogLevel.NONE)
+    assert client.config_path == str(tmp_path / "devbolt.yml")
+    client.destroy()
+
+    (tmp_path / ".devbolt").mkdir()
+    (tmp_path / ".devbolt" / "flags.yaml").write_text("nested_flag:\n  enabled: true\n")
+
+    client = DevBoltClient(auto_reload=False, logger=LogLevel.NONE)
+    assert client.config_path == str(tmp_path / ".devbolt" / "flags.yaml")
+    assert client.is_enabled("nested_flag") is True
+    client.destroy()
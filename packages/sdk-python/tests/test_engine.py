@@ -3,7 +3,8 @@
 import pytest
 
 from devbolt.engine import FlagEngine
-from devbolt.types import EvaluationContext, FlagNotFoundError
+from devbolt.parser import ConfigParser
+from devbolt.types import EvaluationContext, FlagConfig, FlagNotFoundError, TargetingRule
 
 
 def test_engine_from_yaml():
@@ -22,9 +23,9 @@ def test_engine_from_file(simple_config_file):
     assert engine.is_enabled("simple_flag") is True
 
 
-def test_engine_evaluate(simple_config_file):
+def test_engine_evaluate(simple_config_yaml):
     """Test flag evaluation."""
-    engine = FlagEngine.from_file(simple_config_file)
+    engine = FlagEngine.from_yaml(simple_config_yaml)
     result = engine.evaluate("simple_flag")
 
     assert result.enabled is True
@@ -32,9 +33,9 @@ def test_engine_evaluate(simple_config_file):
     assert result.metadata is not None
 
 
-def test_engine_is_enabled(simple_config_file):
+def test_engine_is_enabled(simple_config_yaml):
     """Test is_enabled convenience method."""
-    engine = FlagEngine.from_file(simple_config_file)
+    engine = FlagEngine.from_yaml(simple_config_yaml)
     assert engine.is_enabled("simple_flag") is True
 
 
@@ -64,9 +65,9 @@ test_flag:
         engine.evaluate("missing_flag")
 
 
-def test_engine_get_all_flags(temp_config_file):
+def test_engine_get_all_flags(test_config_yaml):
     """Test getting all flag names."""
-    engine = FlagEngine.from_file(temp_config_file)
+    engine = FlagEngine.from_yaml(test_config_yaml)
     flags = engine.get_all_flags()
 
     assert "test_flag" in flags
@@ -74,9 +75,9 @@ def test_engine_get_all_flags(temp_config_file):
     assert "rollout_flag" in flags
 
 
-def test_engine_get_flag_config(temp_config_file):
+def test_engine_get_flag_config(test_config_yaml):
     """Test getting specific flag config."""
-    engine = FlagEngine.from_file(temp_config_file)
+    engine = FlagEngine.from_yaml(test_config_yaml)
     config = engine.get_flag_config("test_flag")
 
     assert config is not None
@@ -97,9 +98,205 @@ test_flag:
 test_flag:
   enabled: true
 """
-    from devbolt.parser import ConfigParser
-
     new_config = ConfigParser.parse_yaml(new_yaml)
     engine.update_config(new_config)
 
     assert engine.is_enabled("test_flag") is True
+
+
+def test_engine_compiles_targeting():
+    """Test targeting rules are precompiled and evaluated."""
+    yaml_content = """
+beta_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: ends_with
+      value: "@company.com"
+      enabled: false
+      description: "Employees"
+"""
+    engine = FlagEngine.from_yaml(yaml_content)
+    assert "beta_flag" in engine._compiled_targeting
+
+    result = engine.evaluate("beta_flag", EvaluationContext(email="jo@company.com"))
+    assert result.enabled is False
+    assert result.reason == "Matched targeting rule #1: Employees"
+    assert result.metadata.matched_rule == 0
+
+    assert engine.is_enabled("beta_flag", EvaluationContext(email="jo@gmail.com")) is True
+
+
+def test_engine_compiled_targeting_follows_rule_changes():
+    """Test replacing a rule after compiling is reflected in evaluation."""
+    yaml_content = """
+beta_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: ends_with
+      value: "@company.com"
+      enabled: false
+"""
+    engine = FlagEngine.from_yaml(yaml_content)
+    engine.get_flag_config("beta_flag").targeting[0] = TargetingRule(
+        attribute="email", operator="equals", value="x", enabled=False
+    )
+
+    result = engine.evaluate("beta_flag", EvaluationContext(email="jo@company.com"))
+    assert result.enabled is True
+    assert result.metadata.matched_rule is None
+    assert engine.evaluate("beta_flag", EvaluationContext(email="x")).enabled is False
+
+
+def test_engine_compiled_targeting_follows_rule_edits():
+    """Test editing a rule in place is reflected in compiled evaluation."""
+    yaml_content = """
+beta_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: ends_with
+      value: "@company.com"
+      enabled: false
+"""
+    engine = FlagEngine.from_yaml(yaml_content)
+    assert engine.is_enabled("beta_flag", EvaluationContext(email="jo@company.com")) is False
+
+    rule = engine.get_flag_config("beta_flag").targeting[0]
+    rule.value = "@other.com"
+    rule.description = "Others"
+
+    assert engine.is_enabled("beta_flag", EvaluationContext(email="jo@company.com")) is True
+    result = engine.evaluate("beta_flag", EvaluationContext(email="jo@other.com"))
+    assert result.enabled is False
+    assert result.reason == "Matched targeting rule #1: Others"
+
+    # Unchanged flags keep their compiled targeting across updates
+    engine.update_config(engine.get_config())
+    rule.attribute = "team"
+    contexts = [
+        EvaluationContext(email="jo@company.com", custom_attributes={"team": "x@other.com"}),
+        EvaluationContext(email="jo@other.com"),
+    ]
+    assert engine.is_enabled_batch("beta_flag", contexts) == [False, True]
+
+
+def test_engines_sharing_config_keep_their_own_loggers():
+    """Test rule errors are logged by the engine that evaluated the flag."""
+
+    class RecordingLogger:
+        def __init__(self):
+            self.errors = []
+
+        def error(self, message, meta=None):
+            self.errors.append(message)
+
+        def debug(self, message, meta=None):
+            pass
+
+        info = warn = debug
+
+    rule = TargetingRule(attribute="age", operator="greater_than", value="abc", enabled=False)
+    config = {"test_flag": FlagConfig(enabled=True, targeting=[rule])}
+    first_logger, second_logger = RecordingLogger(), RecordingLogger()
+    first = FlagEngine(config, logger=first_logger)
+    FlagEngine(config, logger=second_logger)
+
+    first.evaluate("test_flag", EvaluationContext(custom_attributes={"age": 30}))
+
+    assert len(first_logger.errors) == 1
+    assert second_logger.errors == []
+    assert config["test_flag"] == FlagConfig(enabled=True, targeting=[rule])
+
+
+def test_engine_evaluate_many(test_config_yaml):
+    """Test evaluating several flags at once."""
+    engine = FlagEngine.from_yaml(test_config_yaml)
+    context = EvaluationContext(email="jo@company.com", environment="production")
+
+    results = engine.evaluate_many(["test_flag", "env_flag", "missing_flag"], context)
+    assert results["test_flag"].enabled is True
+    assert results["env_flag"].enabled is False
+    assert results["missing_flag"].reason == "Flag not found"
+
+    assert set(engine.evaluate_many(context=context)) == set(engine.get_all_flags())
+
+
+def test_engine_targeting_custom_attribute():
+    """Test compiled targeting reads standard and custom attributes."""
+    yaml_content = """
+plan_flag:
+  enabled: true
+  targeting:
+    - attribute: plan
+      operator: in
+      values: ["pro", "enterprise"]
+      enabled: false
+    - attribute: userId
+      operator: equals
+      value: "user-1"
+      enabled: false
+"""
+    engine = FlagEngine.from_yaml(yaml_content)
+
+    pro_context = EvaluationContext(custom_attributes={"plan": "pro"})
+    assert engine.is_enabled("plan_flag", pro_context) is False
+    assert engine.is_enabled("plan_flag", EvaluationContext(user_id="user-1")) is False
+    assert engine.is_enabled("plan_flag", EvaluationContext(user_id="user-2")) is True
+
+
+def test_engine_update_config_reuses_unchanged_flags():
+    """Test hot reload keeps compiled state for unchanged flags."""
+    yaml_content = """
+stable_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: ends_with
+      value: "@company.com"
+      enabled: false
+
+changing_flag:
+  enabled: false
+"""
+    engine = FlagEngine.from_yaml(yaml_content)
+    stable = engine.get_flag_config("stable_flag")
+
+    new_yaml = yaml_content.replace(
+        "changing_flag:\n  enabled: false", "changing_flag:\n  enabled: true"
+    )
+    engine.update_config(ConfigParser.parse_yaml(new_yaml))
+
+    assert engine.get_flag_config("stable_flag") is stable
+    assert engine.is_enabled("changing_flag") is True
+    assert engine.is_enabled("stable_flag", EvaluationContext(email="jo@company.com")) is False
+
+
+def test_engine_is_enabled_batch(test_config_yaml):
+    """Test batch checks agree with evaluating each context."""
+    engine = FlagEngine.from_yaml(test_config_yaml)
+    contexts = [
+        EvaluationContext(user_id=f"user-{i}", email=f"user{i}@company.com" if i % 3 else None)
+        for i in range(60)
+    ] + [
+        EvaluationContext(environment="production"),
+        EvaluationContext(user_id="user-1", environment="staging", _hash_seed="other"),
+        EvaluationContext(user_id="user-2", _hash_seed="other"),
+        EvaluationContext(),
+    ]
+
+    for flag_name in engine.get_all_flags():
+        assert engine.is_enabled_batch(flag_name, contexts) == [
+            engine.is_enabled(flag_name, context) for context in contexts
+        ]
+
+
+def test_engine_is_enabled_batch_missing_flag():
+    """Test batch checks of a missing flag."""
+    engine = FlagEngine.from_yaml("test_flag:\n  enabled: true\n")
+    assert engine.is_enabled_batch("missing_flag", [EvaluationContext()] * 2) == [False, False]
+
+    strict_engine = FlagEngine.from_yaml("test_flag:\n  enabled: true\n", strict=True)
+    with pytest.raises(FlagNotFoundError):
+        strict_engine.is_enabled_batch("missing_flag", [EvaluationContext()])
@@ -1,7 +1,16 @@
 """Tests for flag evaluator."""
 
-from devbolt.evaluator import FlagEvaluator
-from devbolt.types import EvaluationContext, FlagConfig, TargetingRule
+from devbolt.evaluator import OPERATOR_MATCHERS, OPERATOR_TABLE, FlagEvaluator
+from devbolt.logger import ConsoleLogger, NoOpLogger, is_debug_enabled
+from devbolt.types import (
+    OPERATOR_CODES,
+    TARGETING_OPERATORS,
+    EvaluationContext,
+    FlagConfig,
+    LogLevel,
+    RolloutConfig,
+    TargetingRule,
+)
 
 
 def test_evaluate_simple_enabled():
@@ -51,8 +60,6 @@ def test_evaluate_environment_override():
 
 def test_evaluate_rollout():
     """Test rollout evaluation."""
-    from devbolt.types import RolloutConfig
-
     evaluator = FlagEvaluator()
     config = FlagConfig(
         enabled=True,
@@ -132,3 +139,247 @@ def test_evaluate_priority():
     )
     assert result.enabled is False
     assert "environment override" in result.reason.lower()
+
+
+def test_evaluate_targeting_matches_regex():
+    """Test targeting with precompiled regex."""
+    evaluator = FlagEvaluator()
+    rule = TargetingRule(
+        attribute="email",
+        operator="matches_regex",
+        value=r"^admin-\d+@",
+        enabled=False,
+    )
+    config = FlagConfig(enabled=True, targeting=[rule])
+
+    assert rule._compiled_regex is not None
+
+    result = evaluator.evaluate("test_flag", config, EvaluationContext(email="admin-7@x.com"))
+    assert result.enabled is False
+    assert result.metadata.matched_rule == 0
+
+    result = evaluator.evaluate("test_flag", config, EvaluationContext(email="user@x.com"))
+    assert result.enabled is True
+
+
+def test_evaluate_targeting_in_and_contains():
+    """Test set membership and case-insensitive string operators."""
+    evaluator = FlagEvaluator()
+    in_rule = TargetingRule(
+        attribute="userId", operator="in", values=["user-1", "user-2"], enabled=False
+    )
+    contains_rule = TargetingRule(
+        attribute="email", operator="contains", value="@Beta.", enabled=False
+    )
+    config = FlagConfig(enabled=True, targeting=[in_rule, contains_rule])
+
+    assert in_rule._values_set == frozenset({"user-1", "user-2"})
+    assert contains_rule._value_lower == "@beta."
+
+    result = evaluator.evaluate("test_flag", config, EvaluationContext(user_id="user-2"))
+    assert result.enabled is False
+
+    result = evaluator.evaluate("test_flag", config, EvaluationContext(email="a@BETA.io"))
+    assert result.enabled is False
+
+    result = evaluator.evaluate("test_flag", config, EvaluationContext(user_id="user-3"))
+    assert result.enabled is True
+
+
+def test_operator_matchers_cover_all_operators():
+    """Test every targeting operator has a matcher."""
+    assert set(OPERATOR_MATCHERS) == set(TARGETING_OPERATORS)
+
+
+def test_operator_table_follows_opcodes():
+    """Test the opcode table dispatches to the operator's matcher."""
+    for operator, code in OPERATOR_CODES.items():
+        assert OPERATOR_TABLE[code] is OPERATOR_MATCHERS[operator]
+
+
+def test_evaluate_rollout_edges_skip_hashing():
+    """Test 0% and 100% rollouts are settled without a bucket."""
+    evaluator = FlagEvaluator()
+    context = EvaluationContext(user_id="user-123")
+
+    result = evaluator.evaluate(
+        "test_flag", FlagConfig(enabled=True, rollout=RolloutConfig(0)), context
+    )
+    assert result.enabled is False
+    assert result.metadata.rollout_bucket is None
+
+    result = evaluator.evaluate(
+        "test_flag", FlagConfig(enabled=True, rollout=RolloutConfig(100)), context
+    )
+    assert result.enabled is True
+    assert result.reason == "Rollout 100%"
+
+
+def test_evaluate_debug_logging_duration():
+    """Test evaluation durations are only logged for debug loggers."""
+    assert is_debug_enabled(NoOpLogger()) is False
+    assert is_debug_enabled(ConsoleLogger(LogLevel.WARN)) is False
+    assert is_debug_enabled(ConsoleLogger(LogLevel.DEBUG)) is True
+
+    messages = []
+
+    class RecordingLogger:
+        def debug(self, message, meta=None):
+            messages.append((message, meta))
+
+        info = warn = error = debug
+
+    evaluator = FlagEvaluator(RecordingLogger())
+    evaluator.evaluate("test_flag", FlagConfig(enabled=True), EvaluationContext())
+
+    message, meta = messages[-1]
+    assert message == "Flag 'test_flag' evaluation complete"
+    assert meta["duration"] >= 0
+
+
+def test_evaluate_skips_debug_messages_when_disabled():
+    """Test no debug messages are built for non-debug loggers."""
+    calls = []
+
+    class QuietLogger:
+        is_debug = False
+
+        def debug(self, message, meta=None):
+            calls.append(message)
+
+        info = warn = error = debug
+
+    evaluator = FlagEvaluator(QuietLogger())
+    rule = TargetingRule(attribute="email", operator="equals", value="a@b.c", enabled=True)
+    config = FlagConfig(
+        enabled=True,
+        targeting=[rule],
+        environments={"staging": True},
+        rollout=RolloutConfig(percentage=50),
+    )
+
+    evaluator.evaluate("test_flag", config, EvaluationContext(email="a@b.c"))
+    evaluator.evaluate("test_flag", config, EvaluationContext(environment="staging"))
+    evaluator.evaluate("test_flag", config, EvaluationContext(user_id="user-1"))
+
+    assert calls == []
+
+
+def test_evaluate_rule_error_is_logged():
+    """Test a failing comparison is logged and treated as no match."""
+    errors = []
+
+    class RecordingLogger:
+        is_debug = False
+
+        def error(self, message, meta=None):
+            errors.append(meta)
+
+        debug = info = warn = error
+
+    rule = TargetingRule(attribute="age", operator="greater_than", value="abc", enabled=False)
+    config = FlagConfig(enabled=True, targeting=[rule])
+    context = EvaluationContext(custom_attributes={"age": 30})
+
+    result = FlagEvaluator(RecordingLogger()).evaluate("test_flag", config, context)
+
+    assert result.enabled is True
+    assert "greater_than" in errors[0]["rule"]
+
+
+def test_rule_edits_after_construction_are_matched():
+    """Test assigning value or values refreshes the rule's matcher state and regex."""
+    evaluator = FlagEvaluator()
+    rule = TargetingRule(attribute="email", operator="ends_with", value="@old.com", enabled=True)
+    rule.value = "@new.com"
+    assert evaluator._rule_matches(rule, EvaluationContext(email="jo@new.com")) is True
+    assert evaluator._rule_matches(rule, EvaluationContext(email="jo@old.com")) is False
+
+    rule = TargetingRule(attribute="userId", operator="in", values=["user-1"], enabled=True)
+    rule.values = ["user-2"]
+    assert rule.values == ("user-2",)
+    assert evaluator._rule_matches(rule, EvaluationContext(user_id="user-2")) is True
+    assert evaluator._rule_matches(rule, EvaluationContext(user_id="user-1")) is False
+
+    rule = TargetingRule(attribute="email", operator="matches_regex", value="@old$", enabled=True)
+    rule.value = "@new$"
+    assert evaluator._rule_matches(rule, EvaluationContext(email="jo@new")) is True
+    assert evaluator._rule_matches(rule, EvaluationContext(email="jo@old")) is False
+
+    rule.value = "[unclosed"
+    assert evaluator._rule_matches(rule, EvaluationContext(email="[unclosed")) is False
+
+
+def test_rule_operator_assignment_changes_dispatch():
+    """Test reassigning the operator dispatches to the new operator's matcher."""
+    evaluator = FlagEvaluator()
+    rule = TargetingRule(attribute="email", operator="equals", value="jo@corp", enabled=True)
+    rule.operator = "not_equals"
+    assert evaluator._rule_matches(rule, EvaluationContext(email="jo@corp")) is False
+    assert evaluator._rule_matches(rule, EvaluationContext(email="al@corp")) is True
+
+    rule.operator = "ends_with"
+    assert evaluator._rule_matches(rule, EvaluationContext(email="al@JO@CORP")) is True
+
+
+def test_compiled_targeting_matches_uncompiled():
+    """Test compiled rule predicates agree with the uncompiled rule loop."""
+    rules = [
+        TargetingRule(attribute="plan", operator="in", values=["pro", "team"], enabled=True),
+        TargetingRule(attribute="plan", operator="not_in", values=[["x"]], enabled=True),
+        TargetingRule(attribute="seats", operator="equals", value=5, enabled=True),
+        TargetingRule(attribute="email", operator="matches_regex", value="@corp$", enabled=True),
+        TargetingRule(attribute="email", operator="starts_with", value="VIP", enabled=True),
+        TargetingRule(attribute="email", operator="ends_with", value="@Corp", enabled=True),
+        TargetingRule(attribute="email", operator="contains", value="EXAMPLE", enabled=True),
+        TargetingRule(attribute="seats", operator="contains", value=5, enabled=True),
+    ]
+    contexts = [
+        EvaluationContext(custom_attributes={"plan": "pro"}),
+        EvaluationContext(custom_attributes={"plan": "free"}),
+        EvaluationContext(custom_attributes={"seats": 5.0}),
+        EvaluationContext(email="dev@corp"),
+        EvaluationContext(email="vip@example.com"),
+        EvaluationContext(email="nobody@example.com"),
+    ]
+
+    evaluator = FlagEvaluator()
+    for rule in rules:
+        # A 0% rollout makes a non-match observable as disabled
+        config = FlagConfig(enabled=True, rollout=RolloutConfig(percentage=0), targeting=[rule])
+        compiled = evaluator.compile_targeting("test_flag", config)
+
+        for context in contexts:
+            expected = evaluator.evaluate("test_flag", config, context)
+            actual = evaluator.evaluate("test_flag", config, context, compiled)
+            assert actual.enabled == expected.enabled
+            assert actual.reason == expected.reason
+            assert actual.metadata.matched_rule == expected.metadata.matched_rule
+
+
+def test_compiled_targeting_follows_rule_edits():
+    """Test compiled predicates are rebuilt after a rule is edited in place."""
+    rule = TargetingRule(attribute="plan", operator="in", values=["pro"], enabled=True)
+    config = FlagConfig(enabled=True, rollout=RolloutConfig(percentage=0), targeting=[rule])
+    evaluator = FlagEvaluator()
+    compiled = evaluator.compile_targeting("test_flag", config)
+    team = EvaluationContext(custom_attributes={"plan": "team"})
+    assert evaluator.evaluate("test_flag", config, team, compiled).enabled is False
+
+    edits = [
+        ("values", ["team"]),
+        ("operator", "equals"),
+        ("value", "team"),
+        ("operator", "matches_regex"),
+        ("value", "^te"),
+        ("value", "^pro"),
+    ]
+    for name, value in edits:
+        setattr(rule, name, value)
+        expected = evaluator.evaluate("test_flag", config, team)
+        actual = evaluator.evaluate("test_flag", config, team, compiled)
+        assert (actual.enabled, actual.reason) == (expected.enabled, expected.reason)
+
+    assert actual.enabled is False
+    rule.value = "^t"
+    assert evaluator.evaluate("test_flag", config, team, compiled).enabled is True
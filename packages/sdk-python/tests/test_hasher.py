@@ -1,5 +1,7 @@
 """Tests for hash utilities."""
 
+import pytest
+
 from devbolt.hasher import Hasher
 
 
@@ -53,3 +55,82 @@ def test_is_in_rollout_approximate():
 
     # Should be approximately 50% (with some margin)
     assert 450 <= enabled_count <= 550
+
+
+def test_get_bucket_known_value():
+    """Test bucket matches the SHA-256 assignment shared with the JS SDK."""
+    assert Hasher.get_bucket("test_flag", "user-123") == 45
+
+
+def test_get_bucket_matches_js_sdk():
+    """Test buckets match values computed by the JS SDK's hasher."""
+    assert Hasher.get_bucket("checkout", "user-1") == 49
+    assert Hasher.get_bucket("checkout", "user-2") == 44
+    assert Hasher.get_bucket("new_ui", "alice@example.com") == 44
+    assert Hasher.get_bucket("new_ui", "bob") == 94
+    assert Hasher.get_bucket("checkout", "user-1", "spring") == 15
+
+
+def test_clear_cache():
+    """Test clearing the cache keeps assignments stable."""
+    bucket = Hasher.get_bucket("test_flag", "user-123", "custom")
+    Hasher.clear_cache()
+    assert Hasher.get_bucket("test_flag", "user-123", "custom") == bucket
+
+
+def test_set_algorithm_blake2b():
+    """Test switching to BLAKE2b keeps buckets valid and distributed."""
+    try:
+        Hasher.set_algorithm("blake2b")
+        buckets = [Hasher.get_bucket("test_flag", f"user-{i}") for i in range(1000)]
+        assert all(0 <= bucket <= 99 for bucket in buckets)
+        assert len(set(buckets)) > 50
+    finally:
+        Hasher.set_algorithm("sha256")
+
+    assert Hasher.get_bucket("test_flag", "user-123") == 45
+
+
+def test_set_algorithm_invalid():
+    """Test unknown hash algorithm is rejected."""
+    with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+        Hasher.set_algorithm("md5")
+
+
+def test_get_buckets_matches_get_bucket():
+    """Test batch bucketing agrees with per-identifier bucketing."""
+    identifiers = [f"user-{i}" for i in range(200)]
+
+    assert Hasher.get_buckets("test_flag", identifiers) == [
+        Hasher.get_bucket("test_flag", identifier) for identifier in identifiers
+    ]
+    assert Hasher.get_buckets("test_flag", iter(identifiers[:5]), "custom") == [
+        Hasher.get_bucket("test_flag", identifier, "custom") for identifier in identifiers[:5]
+    ]
+    assert Hasher.get_buckets("test_flag", []) == []
+
+
+def test_set_algorithm_murmur3():
+    """Test MurmurHash3 bucketing when mmh3 is installed."""
+    pytest.importorskip("mmh3")
+    try:
+        Hasher.set_algorithm("murmur3")
+        buckets = Hasher.get_buckets("test_flag", [f"user-{i}" for i in range(1000)])
+        assert all(0 <= bucket <= 99 for bucket in buckets)
+        assert len(set(buckets)) > 50
+        assert Hasher.get_bucket("test_flag", "user-7") == buckets[7]
+    finally:
+        Hasher.set_algorithm("sha256")
+
+
+def test_is_in_rollout_batch():
+    """Test batch rollout checks agree with per-identifier checks."""
+    identifiers = [f"user-{i}" for i in range(500)]
+
+    for percentage in (0, 12.5, 50, 100):
+        assert Hasher.is_in_rollout_batch("test_flag", identifiers, percentage) == [
+            Hasher.is_in_rollout("test_flag", identifier, percentage) for identifier in identifiers
+        ]
+
+    in_rollout = Hasher.is_in_rollout_batch("test_flag", iter(identifiers), 30, "custom")
+    assert 100 < sum(in_rollout) < 200
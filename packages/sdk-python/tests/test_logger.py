@@ -0,0 +1,65 @@
+"""Tests for logger implementations."""
+
+from devbolt.logger import NOOP_LOGGER, ConsoleLogger, NoOpLogger, create_logger
+from devbolt.types import LogLevel
+
+
+def test_console_logger_respects_level(capsys):
+    """Test messages below the level are suppressed."""
+    logger = ConsoleLogger(LogLevel.WARN)
+
+    logger.debug("debug message", {"key": "value"})
+    logger.info("info message")
+    logger.warn("warn message")
+    logger.error("error message")
+
+    err = capsys.readouterr().err
+    assert "debug message" not in err
+    assert "info message" not in err
+    assert "[DevBolt Warning] warn message" in err
+    assert "[DevBolt Error] error message" in err
+
+
+def test_console_logger_formats_meta(capsys):
+    """Test metadata is appended as compact JSON."""
+    logger = ConsoleLogger(LogLevel.DEBUG)
+    logger.debug("evaluated", {"enabled": True, "bucket": 42})
+
+    assert capsys.readouterr().err == '[DevBolt Debug] evaluated {"enabled":true,"bucket":42}\n'
+
+
+def test_create_logger():
+    """Test logger factory."""
+    assert isinstance(create_logger(LogLevel.NONE), NoOpLogger)
+    assert isinstance(create_logger(LogLevel.INFO), ConsoleLogger)
+
+
+def test_console_logger_level_change(capsys):
+    """Test changing the level after construction takes effect."""
+    logger = ConsoleLogger(LogLevel.ERROR)
+    assert not logger.is_debug
+
+    logger.level = LogLevel.DEBUG
+    logger.debug("now visible")
+
+    assert logger.is_debug
+    assert "now visible" in capsys.readouterr().err
+
+
+def test_noop_logger_accepts_calls():
+    """Test NoOpLogger methods accept messages with and without meta."""
+    logger = create_logger(LogLevel.NONE)
+
+    assert logger is NOOP_LOGGER
+    assert logger.debug("message") is None
+    assert logger.error("message", {"key": "value"}) is None
+
+
+def test_console_logger_meta_fallbacks(capsys):
+    """Test non-JSON values and non-string keys still serialize."""
+    logger = ConsoleLogger(LogLevel.ERROR)
+    logger.error("failed", {"error": ValueError("bad"), 1: "one", "big": 2**70})
+
+    assert capsys.readouterr().err == (
+        '[DevBolt Error] failed {"error":"bad","1":"one","big":1180591620717411303424}\n'
+    )
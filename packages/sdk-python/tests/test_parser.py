@@ -1,9 +1,14 @@
 """Tests for configuration parser."""
 
+import hashlib
+import os
+
 import pytest
+import yaml
 
+from devbolt import parser
 from devbolt.parser import ConfigParser
-from devbolt.types import ConfigParseError
+from devbolt.types import ConfigParseError, RolloutConfig, TargetingRule, ValidationError
 
 
 def test_parse_yaml_simple():
@@ -25,6 +30,9 @@ def test_parse_yaml_invalid():
     with pytest.raises(ConfigParseError):
         ConfigParser.parse_yaml("invalid: yaml: content:")
 
+    with pytest.raises(ConfigParseError, match="Failed to parse YAML"):
+        ConfigParser.parse_yaml('flag:\n  enabled: true\n  description: "\udc80"\n')
+
 
 def test_parse_yaml_not_object():
     """Test parsing non-object YAML."""
@@ -32,12 +40,45 @@ def test_parse_yaml_not_object():
         ConfigParser.parse_yaml("[]")
 
 
+def test_parse_yaml_validation_error_propagates():
+    """Test invalid flag configs raise ValidationError unwrapped."""
+    with pytest.raises(ValidationError, match="must be a boolean"):
+        ConfigParser.parse_yaml("bad_flag:\n  enabled: sometimes\n")
+
+
+def test_parse_yaml_error_keeps_cause():
+    """Test YAML errors are chained as the parse error's cause."""
+    with pytest.raises(ConfigParseError) as exc_info:
+        ConfigParser.parse_yaml("invalid: yaml: content:")
+
+    assert exc_info.value.__cause__ is not None
+    assert "cause" in exc_info.value.details
+
+
 def test_parse_file(simple_config_file):
     """Test parsing from file."""
     config = ConfigParser.parse_file(simple_config_file)
     assert "simple_flag" in config
 
 
+def test_parse_file_utf8(tmp_path):
+    """Test file content is decoded as UTF-8."""
+    config_file = tmp_path / "flags.yml"
+    config_file.write_bytes("utf8_flag:\n  enabled: true\n  description: Café ✓\n".encode("utf-8"))
+
+    config = ConfigParser.parse_file(str(config_file))
+    assert config["utf8_flag"].description == "Café ✓"
+
+
+def test_parse_file_invalid_yaml(tmp_path):
+    """Test malformed YAML in a file raises a parse error."""
+    config_file = tmp_path / "flags.yml"
+    config_file.write_text("invalid: yaml: content:")
+
+    with pytest.raises(ConfigParseError, match="Failed to parse YAML"):
+        ConfigParser.parse_file(str(config_file))
+
+
 def test_parse_file_not_found():
     """Test parsing non-existent file."""
     with pytest.raises(ConfigParseError, match="not found"):
@@ -82,3 +123,172 @@ complex_flag:
 
     assert flag.metadata is not None
     assert flag.metadata["owner"] == "platform-team"
+
+
+def test_parse_file_cached(simple_config_file):
+    """Test unchanged files are served from the cache, isolated from callers."""
+    ConfigParser.clear_cache()
+    first = ConfigParser.parse_file(simple_config_file)
+    first["simple_flag"].enabled = False
+    first["extra_flag"] = first["simple_flag"]
+    second = ConfigParser.parse_file(simple_config_file)
+
+    assert len(parser._content_cache) == 1
+    assert list(second) == ["simple_flag"]
+    assert second["simple_flag"].enabled is True
+
+
+def test_parse_file_cache_invalidated_on_change(simple_config_file):
+    """Test modified files are parsed again."""
+    ConfigParser.parse_file(simple_config_file)
+
+    with open(simple_config_file, "w") as f:
+        f.write("other_flag:\n  enabled: false\n")
+
+    config = ConfigParser.parse_file(simple_config_file)
+    assert "other_flag" in config
+    assert "simple_flag" not in config
+
+
+def test_parse_file_same_size_edit_with_restored_mtime(tmp_path):
+    """Test an edit that keeps the file size and mtime is still parsed."""
+    config_file = tmp_path / "flags.yml"
+    config_file.write_text("rollout_flag:\n  enabled: true\n  rollout:\n    percentage: 10\n")
+    stat = os.stat(config_file)
+    assert ConfigParser.parse_file(str(config_file))["rollout_flag"].rollout.percentage == 10
+
+    config_file.write_text("rollout_flag:\n  enabled: true\n  rollout:\n    percentage: 20\n")
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.stat(config_file).st_size == stat.st_size
+
+    assert ConfigParser.parse_file(str(config_file))["rollout_flag"].rollout.percentage == 20
+
+
+def test_parse_file_touched_not_reparsed(simple_config_file, monkeypatch):
+    """Test a new mtime with unchanged content is served by content digest."""
+    ConfigParser.clear_cache()
+    first = ConfigParser.parse_file(simple_config_file)
+
+    stat = os.stat(simple_config_file)
+    os.utime(simple_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def fail_load(stream):
+        raise AssertionError("unchanged content was parsed again")
+
+    monkeypatch.setattr(ConfigParser, "_load", staticmethod(fail_load))
+    assert ConfigParser.parse_file(simple_config_file) == first
+
+
+def test_yaml_loader_prefers_libyaml():
+    """Test the C loader is used when PyYAML ships with libyaml."""
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert parser._YamlLoader is expected
+
+
+def test_parse_yaml_cached_by_content():
+    """Test identical YAML content is only parsed once, isolated from callers."""
+    ConfigParser.clear_cache()
+    yaml_content = "cached_flag:\n  enabled: true\n"
+
+    first = ConfigParser.parse_yaml(yaml_content)
+    first["cached_flag"].enabled = False
+    first["extra_flag"] = first["cached_flag"]
+    second = ConfigParser.parse_yaml(yaml_content)
+
+    assert len(parser._content_cache) == 1
+    assert list(second) == ["cached_flag"]
+    assert second["cached_flag"].enabled is True
+
+    ConfigParser.parse_yaml(yaml_content + "\n")
+    assert len(parser._content_cache) == 2
+
+
+def test_peek_flag_names(tmp_path):
+    """Test top-level flag names are read without parsing flag bodies."""
+    config_file = tmp_path / "flags.yml"
+    config_file.write_text(
+        """
+first_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: in
+      values: [a, b]
+      enabled: true
+second_flag: {enabled: false, metadata: {owner: team}}
+third_flag:
+  enabled: not-a-bool
+"""
+    )
+
+    names = ConfigParser.peek_flag_names(str(config_file))
+    assert names == {"first_flag", "second_flag", "third_flag"}
+
+
+def test_peek_flag_names_not_object(tmp_path):
+    """Test peeking a non-mapping document raises a parse error."""
+    config_file = tmp_path / "flags.yml"
+    config_file.write_text("- first_flag\n- second_flag\n")
+
+    with pytest.raises(ConfigParseError, match="YAML object"):
+        ConfigParser.peek_flag_names(str(config_file))
+
+    with pytest.raises(ConfigParseError, match="not found"):
+        ConfigParser.peek_flag_names(str(tmp_path / "missing.yml"))
+
+    with pytest.raises(ConfigParseError, match="Failed to read config file"):
+        ConfigParser.peek_flag_names(str(tmp_path))
+
+
+def test_convert_to_dataclasses_keeps_instances():
+    """Test prebuilt dataclasses pass through and dicts are converted."""
+    rollout = RolloutConfig(percentage=50)
+    rule = TargetingRule(attribute="email", operator="equals", value="a", enabled=True)
+
+    config = ConfigParser._convert_to_dataclasses(
+        {
+            "built": {"enabled": True, "rollout": rollout, "targeting": [rule]},
+            "raw": {
+                "enabled": False,
+                "rollout": {"percentage": 10},
+                "targeting": [
+                    {"attribute": "email", "operator": "equals", "value": "b", "enabled": True}
+                ],
+            },
+        }
+    )
+
+    assert config["built"].rollout is rollout
+    assert config["built"].targeting[0] is rule
+    assert config["raw"].rollout == RolloutConfig(percentage=10)
+    assert config["raw"].targeting[0].value == "b"
+
+
+def test_parse_file_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test the content cache is bounded and never serves an edited file."""
+    monkeypatch.setattr(parser, "CONTENT_CACHE_SIZE", 2)
+    ConfigParser.clear_cache()
+
+    files = []
+    for name in ("first", "second", "third"):
+        config_file = tmp_path / f"{name}.yml"
+        config_file.write_text(f"{name}_flag:\n  enabled: true\n")
+        files.append(config_file)
+    paths = [str(config_file) for config_file in files]
+
+    ConfigParser.parse_file(paths[0])
+    ConfigParser.parse_file(paths[1])
+    ConfigParser.parse_file(paths[0])  # marks first as recently used
+    ConfigParser.parse_file(paths[2])  # evicts second
+
+    digests = [hashlib.blake2b(path.read_bytes(), digest_size=16).digest() for path in files]
+    assert list(parser._content_cache) == [digests[0], digests[2]]
+
+    # Same-size edits with the mtime restored are parsed, not served from the cache
+    stat = os.stat(paths[0])
+    for enabled in ("false", "true "):
+        files[0].write_text(f"first_flag:\n  enabled: {enabled}\n")
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        expected = enabled.strip() == "true"
+        assert ConfigParser.parse_file(paths[0])["first_flag"].enabled is expected
+        assert len(parser._content_cache) == 2
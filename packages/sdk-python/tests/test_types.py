@@ -1,8 +1,15 @@
 """Tests for type definitions."""
 
+import sys
+
 import pytest
 
 from devbolt.types import (
+    OPERATOR_CODES,
+    EvaluationContext,
+    EvaluationMetadata,
+    EvaluationResult,
+    FlagConfig,
     RolloutConfig,
     TargetingRule,
     ValidationError,
@@ -40,6 +47,19 @@ def test_targeting_rule_valid():
     assert rule.operator == "equals"
 
 
+def test_targeting_rule_interns_and_encodes_operator():
+    """Test rules intern their attribute and operator and record an opcode."""
+    rule = TargetingRule(
+        attribute="".join(["e", "mail"]),
+        operator="".join(["ends", "_with"]),  # type: ignore[arg-type]
+        value="@example.com",
+        enabled=True,
+    )
+    assert rule.attribute is sys.intern("email")
+    assert rule.operator is sys.intern("ends_with")
+    assert rule._op_code == OPERATOR_CODES["ends_with"]
+
+
 def test_targeting_rule_requires_value():
     """Test targeting rule requires value for non-in operators."""
     with pytest.raises(ValueError, match="requires 'value'"):
@@ -69,3 +89,28 @@ def test_targeting_rule_invalid_operator():
             value="test",
             enabled=True,
         )
+
+
+def test_targeting_rule_invalid_regex():
+    """Test invalid regex pattern is rejected."""
+    with pytest.raises(ValueError, match="Invalid regex"):
+        TargetingRule(
+            attribute="email",
+            operator="matches_regex",
+            value="[unclosed",
+            enabled=True,
+        )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_types_use_slots():
+    """Test config and evaluation types do not carry an instance __dict__."""
+    for instance in (
+        RolloutConfig(percentage=10),
+        TargetingRule(attribute="email", operator="equals", value="a@b.c", enabled=True),
+        EvaluationMetadata(timestamp=0.0),
+        FlagConfig(enabled=True),
+        EvaluationContext(user_id="user-1"),
+        EvaluationResult("flag", True, "reason", EvaluationMetadata(timestamp=0.0)),
+    ):
+        assert not hasattr(instance, "__dict__")
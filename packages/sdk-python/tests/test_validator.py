@@ -1,8 +1,17 @@
 """Tests for configuration validator."""
 
+import sys
+
 import pytest
 
-from devbolt.types import ValidationError
+from devbolt.parser import ConfigParser
+from devbolt.types import (
+    FlagConfig,
+    RolloutConfig,
+    TargetingRule,
+    ValidationError,
+    compile_regex,
+)
 from devbolt.validator import ConfigValidator
 
 
@@ -46,9 +55,18 @@ def test_validate_flag_name():
     with pytest.raises(ValidationError, match="lowercase"):
         ConfigValidator.validate({"flag with spaces": {"enabled": True}})
 
+    with pytest.raises(ValidationError, match="lowercase"):
+        ConfigValidator.validate({"trailing_newline\n": {"enabled": True}})
+
+    with pytest.raises(ValidationError, match="lowercase"):
+        ConfigValidator.validate({"caf\u00e9": {"enabled": True}})
+
     with pytest.raises(ValidationError):
         ConfigValidator.validate({"": {"enabled": True}})
 
+    with pytest.raises(ValidationError, match="maximum length"):
+        ConfigValidator.validate({"A" * 101: {"enabled": True}})
+
 
 def test_validate_enabled_required():
     """Test enabled field is required."""
@@ -119,6 +137,26 @@ def test_validate_targeting():
         )
 
 
+def test_validate_operator_must_be_string():
+    """Test unhashable operators are reported as validation errors."""
+    with pytest.raises(ValidationError, match="invalid operator"):
+        ConfigValidator.validate(
+            {
+                "test_flag": {
+                    "enabled": True,
+                    "targeting": [
+                        {
+                            "attribute": "email",
+                            "operator": ["equals"],
+                            "value": "test",
+                            "enabled": True,
+                        }
+                    ],
+                }
+            }
+        )
+
+
 def test_validate_environments():
     """Test environments validation."""
     # Valid
@@ -143,3 +181,158 @@ def test_validate_environments():
                 }
             }
         )
+
+
+def test_validate_regex_compiled_once():
+    """Test regex patterns are shared between validation and rules."""
+    ConfigParser.clear_cache()
+    config = ConfigParser.parse_yaml(
+        """
+regex_flag:
+  enabled: true
+  targeting:
+    - attribute: email
+      operator: matches_regex
+      value: "^ops-[0-9]+@"
+      enabled: false
+"""
+    )
+
+    rule = config["regex_flag"].targeting[0]
+    assert rule._compiled_regex is compile_regex("^ops-[0-9]+@")
+
+    with pytest.raises(ValidationError, match="invalid regex"):
+        ConfigValidator.validate(
+            {
+                "test_flag": {
+                    "enabled": True,
+                    "targeting": [
+                        {
+                            "attribute": "email",
+                            "operator": "matches_regex",
+                            "value": "[unclosed",
+                            "enabled": True,
+                        }
+                    ],
+                }
+            }
+        )
+
+
+def test_build_returns_dataclasses():
+    """Test validation and construction happen in one pass."""
+    config = ConfigValidator.build(
+        {
+            "test_flag": {
+                "enabled": True,
+                "rollout": {"percentage": 25, "seed": "s"},
+                "targeting": [
+                    {"attribute": "userId", "operator": "in", "values": ["a"], "enabled": True}
+                ],
+            },
+            "empty_targeting": {"enabled": False, "targeting": []},
+        }
+    )
+
+    flag = config["test_flag"]
+    assert isinstance(flag, FlagConfig)
+    assert flag.rollout == RolloutConfig(percentage=25, seed="s")
+    assert isinstance(flag.targeting[0], TargetingRule)
+    assert config["empty_targeting"].targeting is None
+
+
+def test_validate_rejects_null_value():
+    """Test a null rule value is a validation error."""
+    with pytest.raises(ValidationError, match="requires 'value'"):
+        ConfigValidator.validate(
+            {
+                "test_flag": {
+                    "enabled": True,
+                    "targeting": [
+                        {"attribute": "email", "operator": "equals", "value": None, "enabled": True}
+                    ],
+                }
+            }
+        )
+
+
+def test_validate_list_operator_requires_values():
+    """Test in/not_in rules require a non-empty 'values' list."""
+    for operator in ("in", "not_in"):
+        with pytest.raises(ValidationError, match="requires non-empty 'values'") as exc_info:
+            ConfigValidator.validate(
+                {
+                    "test_flag": {
+                        "enabled": True,
+                        "targeting": [
+                            {
+                                "attribute": "userId",
+                                "operator": operator,
+                                "value": "a",
+                                "enabled": True,
+                            }
+                        ],
+                    }
+                }
+            )
+        assert exc_info.value.field == "test_flag.targeting[0].values"
+
+
+def test_build_interns_names():
+    """Test flag names, attributes and operators are interned."""
+    flag_name = "".join(["interned", "_flag"])
+    config = ConfigValidator.build(
+        {
+            flag_name: {
+                "enabled": True,
+                "targeting": [
+                    {
+                        "attribute": "".join(["e", "mail"]),
+                        "operator": "equals",
+                        "value": "a",
+                        "enabled": True,
+                    }
+                ],
+            }
+        }
+    )
+
+    key = next(iter(config))
+    assert key is sys.intern("interned_flag")
+    rule = config[key].targeting[0]
+    assert rule.attribute is sys.intern("email")
+    assert rule.operator is sys.intern("equals")
+
+
+def test_build_optional_fields():
+    """Test absent optional fields default to None and explicit nulls are rejected."""
+    config = ConfigValidator.build({"plain_flag": {"enabled": True}})
+    assert config["plain_flag"] == FlagConfig(enabled=True)
+
+    with pytest.raises(ValidationError, match="rollout must be a dictionary"):
+        ConfigValidator.build({"test_flag": {"enabled": True, "rollout": None}})
+
+    with pytest.raises(ValidationError, match="description must be a string"):
+        ConfigValidator.build({"test_flag": {"enabled": True, "description": None}})
+
+
+def test_validate_rollout_seed():
+    """Test rollout seeds must be strings when present."""
+    config = ConfigValidator.build({"test_flag": {"enabled": True, "rollout": {"percentage": 5}}})
+    assert config["test_flag"].rollout.seed is None
+
+    for seed in (None, 42):
+        with pytest.raises(ValidationError, match="rollout.seed must be a string"):
+            ConfigValidator.validate(
+                {"test_flag": {"enabled": True, "rollout": {"percentage": 5, "seed": seed}}}
+            )
+
+
+def test_build_interns_environment_names():
+    """Test environment override names are interned."""
+    environments = {"".join(["prod", "uction"]): False, "staging": True}
+    config = ConfigValidator.build({"test_flag": {"enabled": True, "environments": environments}})
+
+    built = config["test_flag"].environments
+    assert built == environments
+    assert next(iter(built)) is sys.intern("production")